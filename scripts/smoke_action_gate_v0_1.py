@@ -68,6 +68,7 @@ def main():
 
     # Create gate with default config
     gate = ActionGateV0_1()
+    gate.enable_logging()
     print(f"Initial state: {gate.state.value}")
 
     # Simulated time (deterministic, external)
@@ -0,0 +1,153 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+_l1_kernels.py — compiled array kernels for L1 PhysicalActivity (offline replay)
+
+Used by L1PhysicalActivity.replay() / replay_columns() and, per tick, by the
+L1PhysicalActivity.specialized() tracker (l1_activity_step, only when Numba is
+available). Requires NumPy; Numba is optional: without it the kernels run as
+plain Python over the same arrays.
+
+State codes follow L1State declaration order:
+    0 STILL, 1 FEELING, 2 SCRAPE, 3 DISPLACEMENT, 4 MOVING
+"""
+
+from __future__ import annotations
+import math
+
+import numpy as np
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:  # interpreted fallback
+    NUMBA_AVAILABLE = False
+
+    def njit(*args, **kwargs):
+        if args and callable(args[0]):
+            return args[0]
+        return lambda fn: fn
+
+
+STILL, FEELING, SCRAPE, DISPLACEMENT, MOVING = range(5)
+
+
+@njit("UniTuple(f8, 2)(f8, f8, f8, b1, f8, f8, f8)", cache=True)
+def l1_activity_step(dt_s, activity, encoder, cycle_step, events, activity_decay_rate, encoder_tau_s):
+    """
+    (activity score, encoder conf) after one update() tick.
+
+    The time decays and event / cycle increments of L1PhysicalActivity.update().
+    Compiled eagerly for float64 (int arguments are converted on call), so the
+    first live tick pays no compile cost.
+    """
+    if dt_s > 0:
+        activity *= math.exp(-dt_s * activity_decay_rate)
+        encoder *= math.exp(-dt_s / encoder_tau_s)
+    activity += events
+    if cycle_step:
+        encoder = min(1.0, encoder + 0.15)
+    elif events > 0:
+        encoder = min(1.0, encoder + 0.05)
+    return activity, max(0.0, min(1.0, encoder))
+
+
+@njit(cache=True)
+def l1_state_scan(wall_time, cycle_step, disp, events, direction_conf, lock_moving,
+                  hard_reset_s, activity_decay_rate, encoder_tau_s, gap_s,
+                  activity_threshold_low, activity_threshold_high,
+                  displacement_threshold, direction_conf_threshold,
+                  act_gain_still=1.0, act_gain_scrape=1.0, disp_gain_moving=1.0,
+                  confirm_up=1, confirm_down=1):
+    """
+    (L1 state code, activity score, encoder conf) per sample, from a freshly reset tracker.
+
+    Single pass, no intermediates. Mirrors the timing/activity/encoder recurrences of L1PhysicalActivity.update() and
+    the decision ladder of _compute_l1_state(). The per-sample inputs that need
+    no history are precomputed by the caller (vectorized): `cycle_step`
+    (cycles total increased), `disp` (|dtheta| in rotations), and
+    `direction_conf` / `lock_moving` (lock_state in lock_states_for_moving)
+    as in effect per sample. The gains / confirm counts are L1Config's hysteresis
+    (1.0 / 1 = off).
+    """
+    n = wall_time.shape[0]
+    states = np.empty(n, dtype=np.int8)
+    activity = np.empty(n, dtype=np.float64)
+    encoder = np.empty(n, dtype=np.float64)
+    t_last = 0.0                       # 0.0 == no previous update (as update())
+    have_cycle = False
+    have_event = False
+    t_cycle = 0.0
+    t_event = 0.0
+    act = 0.0
+    enc = 0.0
+    state = STILL
+    pending = -1                       # candidate state awaiting confirmation
+    pending_n = 0
+    for i in range(n):
+        now = wall_time[i]
+        dt = now - t_last if t_last else 0.0
+        t_last = now
+        if dt > hard_reset_s:
+            act = 0.0
+            enc = 0.0
+            dt = 0.0
+            state = STILL
+            pending = -1
+            pending_n = 0
+
+        ev = events[i]
+        if cycle_step[i]:
+            have_cycle = True
+            t_cycle = now
+        if ev > 0:
+            have_event = True
+            t_event = now
+
+        act, enc = l1_activity_step(dt, act, enc, cycle_step[i], ev, activity_decay_rate, encoder_tau_s)
+        activity[i] = act
+        encoder[i] = enc
+
+        gap_c = now - t_cycle if have_cycle else math.inf
+        gap_e = now - t_event if have_event else math.inf
+        d = disp[i]
+
+        a = act
+        if state == STILL:
+            a *= act_gain_still
+        elif state == SCRAPE:
+            a *= act_gain_scrape
+        elif state == DISPLACEMENT or state == MOVING:
+            d *= disp_gain_moving
+
+        if gap_c >= gap_s and gap_e >= gap_s:
+            new = STILL
+        elif a < activity_threshold_low and d < displacement_threshold:
+            new = STILL
+        elif d >= displacement_threshold:
+            if lock_moving[i] or direction_conf[i] >= direction_conf_threshold:
+                new = MOVING
+            else:
+                new = DISPLACEMENT
+        elif a >= activity_threshold_high:
+            new = SCRAPE
+        elif a >= activity_threshold_low:
+            new = FEELING
+        else:
+            new = STILL
+
+        if new != state:
+            if new == pending:
+                pending_n += 1
+            else:
+                pending = new
+                pending_n = 1
+            if pending_n >= (confirm_up if new > state else confirm_down):
+                state = new
+                pending = -1
+                pending_n = 0
+        else:
+            pending = -1
+            pending_n = 0
+        states[i] = state
+    return states, activity, encoder
@@ -18,9 +18,11 @@ Contract: SORA CodeX Contract v1.0
 
 from __future__ import annotations
 from dataclasses import dataclass, field
-from enum import Enum
-from typing import Dict, Any, List, Optional, Callable
+from enum import Enum, IntEnum
+from types import MappingProxyType
+from typing import Dict, Any, FrozenSet, List, Mapping, Optional, Callable, Sequence, Set, Tuple
 import logging
+import sys
 
 
 # === Execution States ===
@@ -53,6 +55,37 @@ class ReasonToken:
     OBSERVE_STARTED = "observe_started"
 
 
+for _name, _token in vars(ReasonToken).copy().items():
+    if not _name.startswith("_") and isinstance(_token, str):
+        setattr(ReasonToken, _name, sys.intern(_token))
+del _name, _token
+
+
+# === Lock State ===
+
+class LockState(IntEnum):
+    """Direction lock state as seen by the gate."""
+    UNLOCKED = 0
+    SOFT_LOCK = 1
+    LOCKED = 2
+
+
+# Backward-compatible entry: ints and known names map to LockState (an int
+# outside the enum raises ValueError); other strings pass through unchanged
+# and never match LOCKED / UNLOCKED.
+_LOCK_STATE_FROM_STR = {s.name: s for s in LockState}
+_LOCK_STATE_NAME = {s: s.name for s in LockState}
+
+
+def _as_lock_state(lock_state: Any) -> Any:
+    """LockState for a non-LockState GateInput.lock_state value (int or name)."""
+    if isinstance(lock_state, bool):
+        raise TypeError(f"lock_state must be a LockState, int or str, not {lock_state!r}")
+    if isinstance(lock_state, int):
+        return LockState(lock_state)
+    return _LOCK_STATE_FROM_STR.get(lock_state, lock_state)
+
+
 # === Decision Outputs ===
 
 class GateDecision(Enum):
@@ -62,23 +95,36 @@ class GateDecision(Enum):
     FORCE_FALLBACK = "FORCE_FALLBACK"
 
 
+# Integer state ids (index into ActionGateV0_1._dispatch)
+_IDLE, _OBSERVE, _ARMED, _ACTIVE, _FALLBACK = range(5)
+_STATES = tuple(GateState)  # id -> GateState (declaration order)
+
+# Interned log strings, by state id (GateState declaration order) / decision member
+_STATE_STR = tuple(sys.intern(s.value) for s in GateState)
+_DECISION_STR = {d: sys.intern(d.value) for d in GateDecision}
+
+
 # === Input/Output Dataclasses ===
 
-@dataclass
+# Shared read-only default for GateInput.fields (no per-instance dict)
+_EMPTY_FIELDS: Mapping[str, Any] = MappingProxyType({})
+
+
+@dataclass(slots=True)
 class GateInput:
     """Input data for gate evaluation."""
     now_ms: int                           # Current timestamp (external, deterministic)
     coherence_score: float = 1.0          # 0.0 - 1.0, pipeline coherence measure
-    lock_state: str = "UNLOCKED"          # LOCKED / SOFT_LOCK / UNLOCKED
+    lock_state: LockState = LockState.UNLOCKED  # LockState, or its int value / name
     data_age_ms: int = 0                  # Age of input data in ms
     rotor_active: bool = False            # Whether rotor is active
     force_fallback: bool = False          # External fallback trigger
     arm_signal: bool = False              # Signal to arm the gate
     activate_signal: bool = False         # Signal to activate
-    fields: Dict[str, Any] = field(default_factory=dict)  # Additional basis fields
+    fields: Mapping[str, Any] = field(default_factory=lambda: _EMPTY_FIELDS)  # Additional basis fields
 
 
-@dataclass
+@dataclass(slots=True)
 class GateOutput:
     """Output from gate evaluation."""
     state: GateState
@@ -86,12 +132,18 @@ class GateOutput:
     reason: str
     timestamp_ms: int
     allowed: bool
-    log_entries: List[str] = field(default_factory=list)
+    log_entries: Sequence[str] = field(default_factory=list)  # _EMPTY_LOG when not collected
+    log_events: FrozenSet[str] = frozenset()   # Event types present in log_entries
+
+    @property
+    def log_text(self) -> str:
+        """All log entries as one newline-joined string (single substring search)."""
+        return "\n".join(self.log_entries)
 
 
 # === Gate Configuration ===
 
-@dataclass
+@dataclass(slots=True)
 class GateConfig:
     """Configuration for the action gate."""
     coherence_threshold: float = 0.6       # Min coherence to stay active
@@ -103,6 +155,10 @@ class GateConfig:
 
 # === Logging ===
 
+# log_entries of every GateOutput when entries are not collected
+_EMPTY_LOG: Tuple[str, ...] = ()
+
+
 def _format_log(event_type: str, **kwargs) -> str:
     """Format a gate log entry."""
     parts = [event_type]
@@ -111,6 +167,117 @@ def _format_log(event_type: str, **kwargs) -> str:
     return " ".join(parts)
 
 
+# Event types (leading token of each log entry)
+_EV_GATE_ENTER = sys.intern("GATE_ENTER")
+_EV_GATE_BASIS = sys.intern("GATE_BASIS")
+_EV_GATE_FALLBACK = sys.intern("GATE_FALLBACK")
+_EV_GATE_DECISION = sys.intern("GATE_DECISION")
+
+
+# Fixed-shape events: same text as _format_log, field order baked in.
+
+def _fmt_gate_enter(state: str, reason: str, from_state: str, t_ms: int) -> str:
+    return f"GATE_ENTER state={state} reason={reason} from_state={from_state} t_ms={t_ms}"
+
+
+def _fmt_gate_fallback(reason: str, t_ms: int) -> str:
+    return f"GATE_FALLBACK reason={reason} t_ms={t_ms}"
+
+
+def _fmt_gate_decision(state: str, output: str) -> str:
+    return f"GATE_DECISION state={state} output={output}"
+
+
+def _fmt_gate_basis(inp: GateInput, lock_state: Any) -> str:
+    """GATE_BASIS for the four fixed basis fields (matches the dict repr)."""
+    return (f"GATE_BASIS fields={{'coherence': '{inp.coherence_score:.2f}', "
+            f"'lock': {_LOCK_STATE_NAME.get(lock_state, lock_state)!r}, "
+            f"'data_age_ms': {inp.data_age_ms!r}, "
+            f"'rotor': {inp.rotor_active!r}}}")
+
+
+# Every GATE_DECISION line, prebuilt: (state id, decision) -> entry
+_DECISION_LINE = {
+    (state_id, decision): _fmt_gate_decision(_STATE_STR[state_id], _DECISION_STR[decision])
+    for state_id in range(len(_STATES)) for decision in GateDecision
+}
+_OBSERVE_HOLD_DECISION = _DECISION_LINE[_OBSERVE, GateDecision.HOLD_OBSERVE]
+_FALLBACK_DECISION = _DECISION_LINE[_FALLBACK, GateDecision.FORCE_FALLBACK]
+
+
+class _NullSink:
+    """Default gate logger: accepts and drops everything, reports INFO disabled."""
+
+    def info(self, *args, **kwargs) -> None:
+        pass
+
+    def isEnabledFor(self, level: int) -> bool:
+        return False
+
+
+_NULL_SINK = _NullSink()
+
+
+# === Condition checks ===
+# Pure functions of the relevant input fields and thresholds (no per-gate
+# state); the fallback check is a single fused test in steady state.
+
+def _check_fallback(force_fallback: bool, data_age_ms: int, coherence_score: float,
+                    stale_threshold_ms: int) -> Optional[str]:
+    """
+    Check if fallback conditions are met.
+    Returns reason token if fallback should be forced, None otherwise.
+
+    Fallback is always possible and dominant.
+    """
+    if not (force_fallback or data_age_ms > stale_threshold_ms or coherence_score < 0.1):
+        return None
+    return _classify_fallback(force_fallback, data_age_ms, stale_threshold_ms)
+
+
+def _classify_fallback(force_fallback: bool, data_age_ms: int, stale_threshold_ms: int) -> str:
+    """Reason token for a tick known to need fallback (in priority order)."""
+    # Explicit fallback request
+    if force_fallback:
+        return ReasonToken.MANUAL_FALLBACK
+
+    # Data too stale
+    if data_age_ms > stale_threshold_ms:
+        return ReasonToken.DATA_STALE
+
+    # Coherence dropped critically
+    return ReasonToken.COHERENCE_DROP
+
+
+def _check_arm(coherence_score: float, lock_state: LockState, arm_signal: bool, arm_min: float) -> bool:
+    """Check if conditions are met to arm the gate."""
+    # Need sufficient coherence
+    if coherence_score < arm_min:
+        return False
+
+    # Need some form of lock
+    if lock_state is LockState.UNLOCKED:
+        return False
+
+    # Need explicit arm signal or sufficient conditions
+    return bool(arm_signal or (lock_state is LockState.LOCKED and coherence_score >= 0.5))
+
+
+def _check_activation(coherence_score: float, lock_state: LockState, activate_signal: bool,
+                      activation_min: float) -> bool:
+    """Check if conditions are met to activate."""
+    # Need strong coherence
+    if coherence_score < activation_min:
+        return False
+
+    # Need locked state
+    if lock_state is not LockState.LOCKED:
+        return False
+
+    # Need activation trigger
+    return bool(activate_signal)
+
+
 # === State Machine ===
 
 class ActionGateV0_1:
@@ -133,14 +300,35 @@ class ActionGateV0_1:
     No randomness. Time only via now_ms input.
     """
 
-    def __init__(self, config: GateConfig = None, logger: logging.Logger = None):
-        self._config = config or GateConfig()
-        self._logger = logger or logging.getLogger(__name__)
+    def __init__(self, config: GateConfig = None, logger: logging.Logger = None,
+                 collect_log_entries: bool = True):
+        self.reconfigure(config or GateConfig())
+        # No logger → _NullSink: nothing reaches `logging` until enable_logging()
+        self._logger = logger if logger is not None else _NULL_SINK
+        # With collect_log_entries=False and INFO disabled on the logger,
+        # log lines are never formatted and GateOutput.log_entries stays empty.
+        self._collect_log_entries = collect_log_entries
+        self.refresh_log_level()
 
         self._state = GateState.IDLE
+        self._state_id = _IDLE
         self._last_transition_ms: Optional[int] = None
         self._transition_count = 0
+        # Per-evaluation log entries; handed to GateOutput.log_entries as-is
+        # (no copy), so each evaluation starts a fresh list.
         self._log_buffer: List[str] = []
+        self._emit_idx = 0  # Entries below this index have been emitted to the logger
+        self._log_events: Set[str] = set()
+        self._last_output: Optional[GateOutput] = None  # Reused by evaluate(reuse_output=True)
+
+        # Indexed by self._state_id
+        self._dispatch = (
+            self._handle_idle,
+            self._handle_observe,
+            self._handle_armed,
+            self._handle_active,
+            self._handle_fallback,
+        )
 
     @property
     def state(self) -> GateState:
@@ -152,194 +340,190 @@ class ActionGateV0_1:
         """Total number of state transitions."""
         return self._transition_count
 
-    def _log(self, entry: str) -> None:
-        """Add log entry to buffer and emit via logger."""
+    def reconfigure(self, config: GateConfig) -> None:
+        """Install `config`; its thresholds are copied to flat attributes read per tick."""
+        self._config = config
+        self._coherence_threshold = config.coherence_threshold
+        self._stale_threshold_ms = config.stale_data_threshold_ms
+        self._arm_min = config.arm_coherence_min
+        self._activation_min = config.activation_coherence_min
+        self._fallback_allowed = config.fallback_always_allowed
+
+    def enable_logging(self, logger: logging.Logger = None) -> None:
+        """Route gate log entries to `logger` (default: this module's logger)."""
+        self._logger = logger if logger is not None else logging.getLogger(__name__)
+        self.refresh_log_level()
+
+    def refresh_log_level(self) -> None:
+        """Re-read the logger's INFO level (cached; call after reconfiguring logging)."""
+        self._emit_log = self._logger.isEnabledFor(logging.INFO)
+        self._log_enabled = self._collect_log_entries or self._emit_log
+
+    def _log(self, event: str, entry: str) -> None:
+        """Add log entry (of event type `event`) to the tick buffer."""
+        self._log_events.add(event)
         self._log_buffer.append(entry)
-        self._logger.info(entry)
 
-    def _enter_state(self, new_state: GateState, reason: str, now_ms: int) -> None:
-        """Transition to a new state with logging."""
-        old_state = self._state
-        self._state = new_state
-        self._last_transition_ms = now_ms
-        self._transition_count += 1
-
-        self._log(_format_log(
-            "GATE_ENTER",
-            state=new_state.value,
-            reason=reason,
-            from_state=old_state.value,
-            t_ms=now_ms
-        ))
-
-    def _check_fallback_conditions(self, inp: GateInput) -> Optional[str]:
+    def _finish_tick(self) -> Tuple[Sequence[str], FrozenSet[str]]:
         """
-        Check if fallback conditions are met.
-        Returns reason token if fallback should be forced, None otherwise.
-
-        Fallback is always possible and dominant.
+        Emit this tick's new entries to the logger as one joined record.
+        Returns (log_entries, log_events) for the GateOutput.
         """
-        # Explicit fallback request
-        if inp.force_fallback:
-            return ReasonToken.MANUAL_FALLBACK
-
-        # Data too stale
-        if inp.data_age_ms > self._config.stale_data_threshold_ms:
-            return ReasonToken.DATA_STALE
-
-        # Coherence dropped critically
-        if inp.coherence_score < 0.1:
-            return ReasonToken.COHERENCE_DROP
-
-        return None
-
-    def _check_arm_conditions(self, inp: GateInput) -> bool:
-        """Check if conditions are met to arm the gate."""
-        # Need sufficient coherence
-        if inp.coherence_score < self._config.arm_coherence_min:
-            return False
-
-        # Need some form of lock
-        if inp.lock_state == "UNLOCKED":
-            return False
-
-        # Need explicit arm signal or sufficient conditions
-        return inp.arm_signal or (inp.lock_state == "LOCKED" and inp.coherence_score >= 0.5)
-
-    def _check_activation_conditions(self, inp: GateInput) -> bool:
-        """Check if conditions are met to activate."""
-        # Need strong coherence
-        if inp.coherence_score < self._config.activation_coherence_min:
-            return False
-
-        # Need locked state
-        if inp.lock_state != "LOCKED":
-            return False
-
-        # Need activation trigger
-        return inp.activate_signal
+        buf = self._log_buffer
+        idx = len(buf)
+        if self._emit_log and idx > self._emit_idx:
+            self._logger.info("\n".join(buf[self._emit_idx:] if self._emit_idx else buf))
+        self._emit_idx = idx
+
+        if not self._collect_log_entries:
+            return _EMPTY_LOG, frozenset()
+        return buf, frozenset(self._log_events)
+
+    def _output(self, decision: GateDecision, reason: str, now_ms: int, allowed: bool,
+                reuse: bool) -> GateOutput:
+        """
+        Finish the tick and build its GateOutput. With `reuse`, the previous
+        reused output is patched in place when state/decision/reason repeat.
+        """
+        log_entries, log_events = self._finish_tick()
+        if reuse:
+            out = self._last_output
+            if (out is not None and out.state is self._state
+                    and out.decision is decision and out.reason == reason):
+                out.timestamp_ms = now_ms
+                out.log_entries = log_entries
+                out.log_events = log_events
+                return out
+            out = GateOutput(self._state, decision, reason, now_ms, allowed, log_entries, log_events)
+            self._last_output = out
+            return out
+        return GateOutput(self._state, decision, reason, now_ms, allowed, log_entries, log_events)
+
+    def _enter_state(self, new_id: int, reason: str, now_ms: int) -> None:
+        """Transition to the state with integer id `new_id`, with logging."""
+        old_id = self._state_id
+        self._state = _STATES[new_id]
+        self._state_id = new_id
+        self._last_transition_ms = now_ms
+        self._transition_count += 1
 
-    def evaluate(self, inp: GateInput) -> GateOutput:
+        if self._log_enabled:
+            self._log(_EV_GATE_ENTER, _fmt_gate_enter(_STATE_STR[new_id], reason, _STATE_STR[old_id], now_ms))
+
+    # --- Per-state transition handlers: (inp, lock_state) -> (decision, reason) ---
+
+    def _handle_idle(self, inp: GateInput, lock_state: LockState) -> Tuple[GateDecision, str]:
+        # IDLE → OBSERVE on any input
+        self._enter_state(_OBSERVE, ReasonToken.INPUT_RECEIVED, inp.now_ms)
+        return GateDecision.HOLD_OBSERVE, ReasonToken.OBSERVE_STARTED
+
+    def _handle_observe(self, inp: GateInput, lock_state: LockState) -> Tuple[GateDecision, str]:
+        # OBSERVE → ARMED if conditions met
+        if _check_arm(inp.coherence_score, lock_state, inp.arm_signal, self._arm_min):
+            self._enter_state(_ARMED, ReasonToken.ARMED_CONDITION_MET, inp.now_ms)
+            return GateDecision.HOLD_OBSERVE, ReasonToken.ARMED_CONDITION_MET
+        return GateDecision.HOLD_OBSERVE, ReasonToken.INSUFFICIENT_CONTEXT
+
+    def _handle_armed(self, inp: GateInput, lock_state: LockState) -> Tuple[GateDecision, str]:
+        # ARMED → ACTIVE if activation conditions met
+        if _check_activation(inp.coherence_score, lock_state, inp.activate_signal, self._activation_min):
+            self._enter_state(_ACTIVE, ReasonToken.ACTIVATION_TRIGGERED, inp.now_ms)
+            return GateDecision.ALLOW_ACTIVE, ReasonToken.ACTIVATION_TRIGGERED
+        # ARMED → OBSERVE if conditions lost
+        if not _check_arm(inp.coherence_score, lock_state, inp.arm_signal, self._arm_min):
+            self._enter_state(_OBSERVE, ReasonToken.LOCK_LOST, inp.now_ms)
+            return GateDecision.HOLD_OBSERVE, ReasonToken.LOCK_LOST
+        return GateDecision.HOLD_OBSERVE, ReasonToken.ARMED_CONDITION_MET
+
+    def _handle_active(self, inp: GateInput, lock_state: LockState) -> Tuple[GateDecision, str]:
+        # ACTIVE → OBSERVE if coherence drops
+        if inp.coherence_score < self._coherence_threshold:
+            self._enter_state(_OBSERVE, ReasonToken.COHERENCE_DROP, inp.now_ms)
+            return GateDecision.HOLD_OBSERVE, ReasonToken.COHERENCE_DROP
+        # ACTIVE → OBSERVE if lock lost
+        if lock_state is LockState.UNLOCKED:
+            self._enter_state(_OBSERVE, ReasonToken.LOCK_LOST, inp.now_ms)
+            return GateDecision.HOLD_OBSERVE, ReasonToken.LOCK_LOST
+        return GateDecision.ALLOW_ACTIVE, ReasonToken.ACTIVATION_TRIGGERED
+
+    def _handle_fallback(self, inp: GateInput, lock_state: LockState) -> Tuple[GateDecision, str]:
+        # FALLBACK → IDLE on reset (no force_fallback, good coherence)
+        if not inp.force_fallback and inp.coherence_score >= self._coherence_threshold:
+            self._enter_state(_IDLE, ReasonToken.SAFETY_RESET, inp.now_ms)
+            return GateDecision.HOLD_OBSERVE, ReasonToken.SAFETY_RESET
+        return GateDecision.FORCE_FALLBACK, ReasonToken.SAFETY_RESET
+
+    def evaluate(self, inp: GateInput, reuse_output: bool = False) -> GateOutput:
         """
         Evaluate gate state based on input. Deterministic.
 
         Returns GateOutput with new state, decision, and logs.
+        With reuse_output=True, a tick that repeats the previous reused
+        state/decision/reason returns that same GateOutput object, updated in
+        place (callers must not keep it across ticks). force_fallback() and
+        reset() end the reuse: the next reused output is a new object.
         """
         self._log_buffer = []  # Reset per evaluation
+        self._emit_idx = 0
+        self._log_events.clear()
+
+        stale_threshold_ms = self._stale_threshold_ms
+        now_ms = inp.now_ms
+        coherence = inp.coherence_score
+        data_age_ms = inp.data_age_ms
+        force_fallback = inp.force_fallback
+        # Converted once per tick; GateInput keeps whatever the caller assigned
+        lock_state = inp.lock_state
+        if type(lock_state) is not LockState:
+            lock_state = _as_lock_state(lock_state)
 
         # Log basis fields
-        basis_fields = {
-            "coherence": f"{inp.coherence_score:.2f}",
-            "lock": inp.lock_state,
-            "data_age_ms": inp.data_age_ms,
-            "rotor": inp.rotor_active,
-        }
-        if inp.fields:
-            basis_fields.update({k: str(v) for k, v in inp.fields.items()})
-
-        self._log(_format_log("GATE_BASIS", fields=basis_fields))
+        log_enabled = self._log_enabled
+        if log_enabled:
+            if inp.fields:
+                basis_fields = {
+                    "coherence": f"{coherence:.2f}",
+                    "lock": _LOCK_STATE_NAME.get(lock_state, lock_state),
+                    "data_age_ms": data_age_ms,
+                    "rotor": inp.rotor_active,
+                }
+                basis_fields.update({k: str(v) for k, v in inp.fields.items()})
+                self._log(_EV_GATE_BASIS, _format_log(_EV_GATE_BASIS, fields=basis_fields))
+            else:
+                self._log(_EV_GATE_BASIS, _fmt_gate_basis(inp, lock_state))
+
+        # === Fast path: steady OBSERVE tick (no fallback, cannot arm) ===
+        if (self._state_id == _OBSERVE
+                and not force_fallback
+                and data_age_ms <= stale_threshold_ms
+                and coherence >= 0.1
+                and (coherence < self._arm_min or lock_state is LockState.UNLOCKED)):
+            if log_enabled:
+                self._log(_EV_GATE_DECISION, _OBSERVE_HOLD_DECISION)
+            return self._output(GateDecision.HOLD_OBSERVE, ReasonToken.INSUFFICIENT_CONTEXT, now_ms,
+                                False, reuse_output)
 
         # === Fallback check (always first, always dominant) ===
-        fallback_reason = self._check_fallback_conditions(inp)
-        if fallback_reason and self._config.fallback_always_allowed:
-            if self._state != GateState.FALLBACK:
-                self._enter_state(GateState.FALLBACK, fallback_reason, inp.now_ms)
-
-            self._log(_format_log(
-                "GATE_FALLBACK",
-                reason=fallback_reason,
-                t_ms=inp.now_ms
-            ))
-            self._log(_format_log(
-                "GATE_DECISION",
-                state=self._state.value,
-                output=GateDecision.FORCE_FALLBACK.value
-            ))
-
-            return GateOutput(
-                state=self._state,
-                decision=GateDecision.FORCE_FALLBACK,
-                reason=fallback_reason,
-                timestamp_ms=inp.now_ms,
-                allowed=False,
-                log_entries=list(self._log_buffer)
-            )
+        fallback_reason = _check_fallback(force_fallback, data_age_ms, coherence,
+                                          stale_threshold_ms)
+        if fallback_reason and self._fallback_allowed:
+            if self._state_id != _FALLBACK:
+                self._enter_state(_FALLBACK, fallback_reason, now_ms)
+
+            if log_enabled:
+                self._log(_EV_GATE_FALLBACK, _fmt_gate_fallback(fallback_reason, now_ms))
+                self._log(_EV_GATE_DECISION, _FALLBACK_DECISION)
+
+            return self._output(GateDecision.FORCE_FALLBACK, fallback_reason, now_ms, False, reuse_output)
 
         # === State-specific transitions ===
-        decision = GateDecision.HOLD_OBSERVE
-        reason = ReasonToken.INSUFFICIENT_CONTEXT
-
-        if self._state == GateState.IDLE:
-            # IDLE → OBSERVE on any input
-            self._enter_state(GateState.OBSERVE, ReasonToken.INPUT_RECEIVED, inp.now_ms)
-            reason = ReasonToken.OBSERVE_STARTED
-            decision = GateDecision.HOLD_OBSERVE
-
-        elif self._state == GateState.OBSERVE:
-            # OBSERVE → ARMED if conditions met
-            if self._check_arm_conditions(inp):
-                self._enter_state(GateState.ARMED, ReasonToken.ARMED_CONDITION_MET, inp.now_ms)
-                reason = ReasonToken.ARMED_CONDITION_MET
-                decision = GateDecision.HOLD_OBSERVE
-            else:
-                reason = ReasonToken.INSUFFICIENT_CONTEXT
-                decision = GateDecision.HOLD_OBSERVE
-
-        elif self._state == GateState.ARMED:
-            # ARMED → ACTIVE if activation conditions met
-            if self._check_activation_conditions(inp):
-                self._enter_state(GateState.ACTIVE, ReasonToken.ACTIVATION_TRIGGERED, inp.now_ms)
-                reason = ReasonToken.ACTIVATION_TRIGGERED
-                decision = GateDecision.ALLOW_ACTIVE
-            # ARMED → OBSERVE if conditions lost
-            elif not self._check_arm_conditions(inp):
-                self._enter_state(GateState.OBSERVE, ReasonToken.LOCK_LOST, inp.now_ms)
-                reason = ReasonToken.LOCK_LOST
-                decision = GateDecision.HOLD_OBSERVE
-            else:
-                reason = ReasonToken.ARMED_CONDITION_MET
-                decision = GateDecision.HOLD_OBSERVE
-
-        elif self._state == GateState.ACTIVE:
-            # ACTIVE → OBSERVE if coherence drops
-            if inp.coherence_score < self._config.coherence_threshold:
-                self._enter_state(GateState.OBSERVE, ReasonToken.COHERENCE_DROP, inp.now_ms)
-                reason = ReasonToken.COHERENCE_DROP
-                decision = GateDecision.HOLD_OBSERVE
-            # ACTIVE → OBSERVE if lock lost
-            elif inp.lock_state == "UNLOCKED":
-                self._enter_state(GateState.OBSERVE, ReasonToken.LOCK_LOST, inp.now_ms)
-                reason = ReasonToken.LOCK_LOST
-                decision = GateDecision.HOLD_OBSERVE
-            else:
-                reason = ReasonToken.ACTIVATION_TRIGGERED
-                decision = GateDecision.ALLOW_ACTIVE
-
-        elif self._state == GateState.FALLBACK:
-            # FALLBACK → IDLE on reset (no force_fallback, good coherence)
-            if not inp.force_fallback and inp.coherence_score >= self._config.coherence_threshold:
-                self._enter_state(GateState.IDLE, ReasonToken.SAFETY_RESET, inp.now_ms)
-                reason = ReasonToken.SAFETY_RESET
-                decision = GateDecision.HOLD_OBSERVE
-            else:
-                reason = ReasonToken.SAFETY_RESET
-                decision = GateDecision.FORCE_FALLBACK
+        decision, reason = self._dispatch[self._state_id](inp, lock_state)
 
         # Log decision
-        self._log(_format_log(
-            "GATE_DECISION",
-            state=self._state.value,
-            output=decision.value
-        ))
+        if log_enabled:
+            self._log(_EV_GATE_DECISION, _DECISION_LINE[self._state_id, decision])
 
-        return GateOutput(
-            state=self._state,
-            decision=decision,
-            reason=reason,
-            timestamp_ms=inp.now_ms,
-            allowed=(decision == GateDecision.ALLOW_ACTIVE),
-            log_entries=list(self._log_buffer)
-        )
+        return self._output(decision, reason, now_ms, decision is GateDecision.ALLOW_ACTIVE, reuse_output)
 
     def force_fallback(self, now_ms: int, reason: str = None) -> GateOutput:
         """
@@ -347,20 +531,19 @@ class ActionGateV0_1:
         Always allowed, always succeeds.
         """
         reason = reason or ReasonToken.MANUAL_FALLBACK
+        self._last_output = None
+        # Entries carry over from the last tick, but that list now belongs to
+        # the previous GateOutput: extend a copy.
+        self._log_buffer = self._log_buffer[:]
 
-        if self._state != GateState.FALLBACK:
-            self._enter_state(GateState.FALLBACK, reason, now_ms)
+        if self._state_id != _FALLBACK:
+            self._enter_state(_FALLBACK, reason, now_ms)
 
-        self._log(_format_log(
-            "GATE_FALLBACK",
-            reason=reason,
-            t_ms=now_ms
-        ))
-        self._log(_format_log(
-            "GATE_DECISION",
-            state=self._state.value,
-            output=GateDecision.FORCE_FALLBACK.value
-        ))
+        if self._log_enabled:
+            self._log(_EV_GATE_FALLBACK, _fmt_gate_fallback(reason, now_ms))
+            self._log(_EV_GATE_DECISION, _FALLBACK_DECISION)
+
+        log_entries, log_events = self._finish_tick()
 
         return GateOutput(
             state=self._state,
@@ -368,18 +551,23 @@ class ActionGateV0_1:
             reason=reason,
             timestamp_ms=now_ms,
             allowed=False,
-            log_entries=list(self._log_buffer)
+            log_entries=log_entries,
+            log_events=log_events
         )
 
     def reset(self, now_ms: int) -> None:
         """Reset gate to IDLE state."""
+        self._last_output = None
         self._log_buffer = []
-        self._enter_state(GateState.IDLE, ReasonToken.INIT_COMPLETE, now_ms)
+        self._emit_idx = 0
+        self._log_events.clear()
+        self._enter_state(_IDLE, ReasonToken.INIT_COMPLETE, now_ms)
+        self._finish_tick()
 
     def get_debug_state(self) -> Dict[str, Any]:
         """Get debug state snapshot."""
         return {
-            "state": self._state.value,
+            "state": _STATE_STR[self._state_id],
             "transition_count": self._transition_count,
             "last_transition_ms": self._last_transition_ms,
         }
@@ -25,8 +25,15 @@ Contract: SORA CodeX Contract v1.0 / D-C Contract v0.2
 from __future__ import annotations
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import Dict, Any, List, Optional
+from types import MappingProxyType
+from typing import Dict, Any, FrozenSet, List, Mapping, NamedTuple, Optional, Sequence, Set, Tuple
 import logging
+import sys
+
+try:
+    import numpy as np
+except ImportError:  # evaluate_many() unavailable
+    np = None
 
 
 # === Execution States ===
@@ -91,11 +98,43 @@ class GateDecision(Enum):
     FORCE_FALLBACK = "FORCE_FALLBACK"
 
 
-# === Input/Output Dataclasses ===
+# Integer state ids (declaration order): the gate tracks and dispatches on these
+# (Enum hashing/equality runs in Python; int compares and tuple indexing do not)
+_IDLE, _OBSERVE, _ARMED, _ACTIVE, _FALLBACK = range(5)
+_STATES = tuple(GateState)  # id -> GateState
+
+# Interned log strings (lookup instead of .value per use); states by id
+_STATE_STR = tuple(sys.intern(s.value) for s in GateState)
+_INTENT_STR = {i: sys.intern(i.value) for i in ActionIntent}
+_DECISION_STR = {d: sys.intern(d.value) for d in GateDecision}
+
+# Integer codes (declaration order) for the batch API, evaluate_many();
+# state codes are the state ids
+_DECISION_CODE = {d: i for i, d in enumerate(GateDecision)}
+_INTENTS = tuple(ActionIntent)
+
+# (state id, intent) -> (allowed, reason) for INTENT_ACTIVATE / INTENT_HOLD,
+# see ActionGateV0_2._check_intent_for_activation()
+_INTENT_RULES: Dict[Tuple[int, ActionIntent], Tuple[bool, str]] = {}
+for _s in range(len(_STATES)):
+    _INTENT_RULES[_s, ActionIntent.INTENT_ACTIVATE] = (
+        (True, ReasonToken.INTENT_ACTIVATE_ACCEPTED) if _s == _ARMED
+        else (False, ReasonToken.INTENT_ACTIVATE_REJECTED))
+    _INTENT_RULES[_s, ActionIntent.INTENT_HOLD] = (
+        (True, ReasonToken.INTENT_HOLD_ACCEPTED) if _s in (_ARMED, _ACTIVE)
+        else (False, ReasonToken.INTENT_HOLD_REJECTED))
+del _s
+_INTENT_RELEASE_RULE = (False, ReasonToken.INTENT_RELEASE)
+
+
+# === Input/Output Types ===
+
+class GateInput(NamedTuple):
+    """
+    Input data for gate evaluation (v0.2).
 
-@dataclass
-class GateInput:
-    """Input data for gate evaluation (v0.2)."""
+    Immutable; derive per-tick variants with `inp._replace(now_ms=..., ...)`.
+    """
     now_ms: int                           # Current timestamp (external, deterministic)
     coherence_score: float = 1.0          # 0.0 - 1.0, pipeline coherence measure
     lock_state: str = "UNLOCKED"          # LOCKED / SOFT_LOCK / UNLOCKED
@@ -107,10 +146,10 @@ class GateInput:
     # v0.2: Action Intent
     action_intent: ActionIntent = ActionIntent.INTENT_NONE
     intent_source: str = "unknown"        # Source identifier for logging
-    fields: Dict[str, Any] = field(default_factory=dict)  # Additional basis fields
+    fields: Mapping[str, Any] = MappingProxyType({})  # Additional basis fields
 
 
-@dataclass
+@dataclass(slots=True)
 class GateOutput:
     """Output from gate evaluation (v0.2)."""
     state: GateState
@@ -121,12 +160,13 @@ class GateOutput:
     # v0.2: Intent tracking in output
     intent_received: ActionIntent = ActionIntent.INTENT_NONE
     intent_accepted: bool = False
-    log_entries: List[str] = field(default_factory=list)
+    log_entries: Sequence[str] = field(default_factory=list)  # _EMPTY_LOG when not collected
+    log_events: FrozenSet[str] = frozenset()   # Event types present in log_entries
 
 
 # === Gate Configuration ===
 
-@dataclass
+@dataclass(slots=True)
 class GateConfig:
     """Configuration for the action gate."""
     coherence_threshold: float = 0.6       # Min coherence to stay active
@@ -140,6 +180,10 @@ class GateConfig:
 
 # === Logging ===
 
+# log_entries of every GateOutput when entries are not collected
+_EMPTY_LOG: Tuple[str, ...] = ()
+
+
 def _format_log(event_type: str, **kwargs) -> str:
     """Format a gate log entry."""
     parts = [event_type]
@@ -148,6 +192,50 @@ def _format_log(event_type: str, **kwargs) -> str:
     return " ".join(parts)
 
 
+# Fixed-key events on every tick: same text as _format_log, keys baked in.
+# `basis` is the already-rendered basis dict (str(dict), as _format_log prints it).
+_BASIS_TEMPLATE = "GATE_BASIS fields={}"
+_DECISION_TEMPLATE = "GATE_DECISION state={} output={} intent={} basis={}"
+_FALLBACK_TEMPLATE = "GATE_FALLBACK reason={} t_ms={}"
+
+
+def _fmt_basis(coherence: float, lock_state: str, data_age_ms: int, rotor_active: bool) -> str:
+    """Basis text for the four fixed basis fields (matches the dict repr)."""
+    return (f"{{'coherence': '{coherence:.2f}', 'lock': {lock_state!r}, "
+            f"'data_age_ms': {data_age_ms!r}, 'rotor': {rotor_active!r}}}")
+
+
+# Coherence below this always forces fallback (evaluate() and evaluate_many())
+_FALLBACK_COHERENCE_MIN = 0.1
+
+
+# Member constants bound once for the gate methods (one global load per use)
+_RT_ACTIVATION_TRIGGERED = ReasonToken.ACTIVATION_TRIGGERED
+_RT_ARMED_CONDITION_MET = ReasonToken.ARMED_CONDITION_MET
+_RT_COHERENCE_DROP = ReasonToken.COHERENCE_DROP
+_RT_DATA_STALE = ReasonToken.DATA_STALE
+_RT_INIT_COMPLETE = ReasonToken.INIT_COMPLETE
+_RT_INPUT_RECEIVED = ReasonToken.INPUT_RECEIVED
+_RT_INSUFFICIENT_CONTEXT = ReasonToken.INSUFFICIENT_CONTEXT
+_RT_INTENT_ACTIVATE_REJECTED = ReasonToken.INTENT_ACTIVATE_REJECTED
+_RT_INTENT_RELEASE = ReasonToken.INTENT_RELEASE
+_RT_LOCK_LOST = ReasonToken.LOCK_LOST
+_RT_MANUAL_FALLBACK = ReasonToken.MANUAL_FALLBACK
+_RT_NO_INTENT = ReasonToken.NO_INTENT
+_RT_OBSERVE_STARTED = ReasonToken.OBSERVE_STARTED
+_RT_SAFETY_RESET = ReasonToken.SAFETY_RESET
+_ALLOW_ACTIVE = GateDecision.ALLOW_ACTIVE
+_FORCE_FALLBACK = GateDecision.FORCE_FALLBACK
+_HOLD_OBSERVE = GateDecision.HOLD_OBSERVE
+_INTENT_ACTIVATE = ActionIntent.INTENT_ACTIVATE
+_INTENT_NONE = ActionIntent.INTENT_NONE
+_INTENT_RELEASE = ActionIntent.INTENT_RELEASE
+
+# force_fallback() always ends in FALLBACK without intent or basis: fixed GATE_DECISION line
+_FORCE_FALLBACK_DECISION = _DECISION_TEMPLATE.format(
+    _STATE_STR[_FALLBACK], _DECISION_STR[_FORCE_FALLBACK], _INTENT_STR[_INTENT_NONE], {})
+
+
 # === State Machine ===
 
 class ActionGateV0_2:
@@ -174,18 +262,47 @@ class ActionGateV0_2:
 
     All transitions are deterministic based on GateInput.
     No randomness. Time only via now_ms input.
+
+    collect_log_entries=False drops the per-tick entry list: outputs carry the
+    shared empty tuple _EMPTY_LOG instead, saving one list per tick for callers
+    that only use the logger (or nothing). Log lines are still emitted when
+    the logger has INFO enabled.
     """
 
     VERSION = "0.2"
 
-    def __init__(self, config: GateConfig = None, logger: logging.Logger = None):
-        self._config = config or GateConfig()
+    __slots__ = (
+        "_config", "_coherence_threshold", "_stale_threshold_ms", "_arm_min",
+        "_activation_min", "_fallback_allowed", "_require_intent",
+        "_logger", "_log_info", "_collect_log_entries", "_emit_log", "_log_enabled",
+        "_state", "_state_id", "_last_transition_ms", "_transition_count",
+        "_log_buffer", "_log_events", "_dispatch",
+    )
+
+    def __init__(self, config: GateConfig = None, logger: logging.Logger = None,
+                 collect_log_entries: bool = True):
+        self.reconfigure(config or GateConfig())
         self._logger = logger or logging.getLogger(__name__)
+        # With collect_log_entries=False and INFO disabled on the logger,
+        # log lines are never formatted and GateOutput.log_entries stays empty.
+        self._collect_log_entries = collect_log_entries
+        self.refresh_log_level()
 
         self._state = GateState.IDLE
+        self._state_id = _IDLE
         self._last_transition_ms: Optional[int] = None
         self._transition_count = 0
         self._log_buffer: List[str] = []
+        self._log_events: Set[str] = set()
+
+        # Transition handler, indexed by self._state_id
+        self._dispatch = (
+            self._handle_idle,
+            self._handle_observe,
+            self._handle_armed,
+            self._handle_active,
+            self._handle_fallback,
+        )
 
     @property
     def state(self) -> GateState:
@@ -197,72 +314,107 @@ class ActionGateV0_2:
         """Total number of state transitions."""
         return self._transition_count
 
-    def _log(self, entry: str) -> None:
-        """Add log entry to buffer and emit via logger."""
-        self._log_buffer.append(entry)
-        self._logger.info(entry)
-
-    def _enter_state(self, new_state: GateState, reason: str, now_ms: int) -> None:
-        """Transition to a new state with logging."""
-        old_state = self._state
-        self._state = new_state
+    def reconfigure(self, config: GateConfig) -> None:
+        """Install `config`; its thresholds are copied to flat attributes read per tick."""
+        self._config = config
+        self._coherence_threshold = config.coherence_threshold
+        self._stale_threshold_ms = config.stale_data_threshold_ms
+        self._arm_min = config.arm_coherence_min
+        self._activation_min = config.activation_coherence_min
+        self._fallback_allowed = config.fallback_always_allowed
+        self._require_intent = config.require_intent_for_active
+
+    def refresh_log_level(self) -> None:
+        """Re-read the logger's INFO level (cached; call after reconfiguring logging)."""
+        self._emit_log = self._logger.isEnabledFor(logging.INFO)
+        self._log_enabled = self._collect_log_entries or self._emit_log
+        self._log_info = self._logger.info  # Bound once; only called when _emit_log
+
+    def _log(self, event_type: str, **kwargs) -> None:
+        """Format a log entry, add it to the buffer and emit via logger."""
+        self._log_entry(event_type, _format_log(event_type, **kwargs))
+
+    def _log_entry(self, event_type: str, entry: str) -> None:
+        """Add an already formatted log entry to the buffer and emit via logger."""
+        if self._collect_log_entries:
+            self._log_buffer.append(entry)
+            self._log_events.add(event_type)
+        if self._emit_log:
+            self._log_info(entry)
+
+    def _log_result(self) -> tuple[Sequence[str], FrozenSet[str]]:
+        """(log_entries, log_events) for the GateOutput of this tick."""
+        if not self._collect_log_entries:
+            return _EMPTY_LOG, frozenset()
+        return self._log_buffer, frozenset(self._log_events)
+
+    def _enter_state(self, new_id: int, reason: str, now_ms: int) -> None:
+        """Transition to a new state (by state id) with logging."""
+        old_id = self._state_id
+        self._state = _STATES[new_id]
+        self._state_id = new_id
         self._last_transition_ms = now_ms
         self._transition_count += 1
 
-        self._log(_format_log(
-            "GATE_ENTER",
-            state=new_state.value,
-            reason=reason,
-            from_state=old_state.value,
-            t_ms=now_ms
-        ))
+        if self._log_enabled:
+            self._log(
+                "GATE_ENTER",
+                state=_STATE_STR[new_id],
+                reason=reason,
+                from_state=_STATE_STR[old_id],
+                t_ms=now_ms
+            )
 
-    def _check_fallback_conditions(self, inp: GateInput) -> Optional[str]:
+    def _check_fallback_conditions(self, intent: ActionIntent, force_fallback: bool,
+                                   data_age_ms: int, coherence_score: float) -> Optional[str]:
         """
         Check if fallback conditions are met.
         Returns reason token if fallback should be forced, None otherwise.
 
         Fallback is always possible and dominant.
         """
+        # Common no-fallback tick: one fused test, most frequent triggers first
+        if not (coherence_score < _FALLBACK_COHERENCE_MIN or data_age_ms > self._stale_threshold_ms
+                or force_fallback or intent is _INTENT_RELEASE):
+            return None
+
+        # Reason token in priority order
         # v0.2: INTENT_RELEASE always forces fallback
-        if inp.action_intent == ActionIntent.INTENT_RELEASE:
-            return ReasonToken.INTENT_RELEASE
+        if intent is _INTENT_RELEASE:
+            return _RT_INTENT_RELEASE
 
         # Explicit fallback request
-        if inp.force_fallback:
-            return ReasonToken.MANUAL_FALLBACK
+        if force_fallback:
+            return _RT_MANUAL_FALLBACK
 
         # Data too stale
-        if inp.data_age_ms > self._config.stale_data_threshold_ms:
-            return ReasonToken.DATA_STALE
+        if data_age_ms > self._stale_threshold_ms:
+            return _RT_DATA_STALE
 
         # Coherence dropped critically
-        if inp.coherence_score < 0.1:
-            return ReasonToken.COHERENCE_DROP
-
-        return None
+        return _RT_COHERENCE_DROP
 
-    def _check_arm_conditions(self, inp: GateInput) -> bool:
+    def _check_arm_conditions(self, coherence_score: float, lock_state: str, arm_signal: bool) -> bool:
         """Check if conditions are met to arm the gate."""
         # Need sufficient coherence
-        if inp.coherence_score < self._config.arm_coherence_min:
+        if coherence_score < self._arm_min:
             return False
 
         # Need some form of lock
-        if inp.lock_state == "UNLOCKED":
+        if lock_state == "UNLOCKED":
             return False
 
         # Need explicit arm signal or sufficient conditions
-        return inp.arm_signal or (inp.lock_state == "LOCKED" and inp.coherence_score >= 0.5)
+        return arm_signal or (lock_state == "LOCKED" and coherence_score >= 0.5)
 
-    def _check_activation_conditions(self, inp: GateInput) -> bool:
+    def _check_activation_conditions(self, coherence_score: float, lock_state: str) -> bool:
         """Check if conditions are met to activate (execution-context only)."""
         # Need strong coherence
-        if inp.coherence_score < self._config.activation_coherence_min:
+        if coherence_score < self._activation_min:
             return False
 
         # Need locked state
-        if inp.lock_state != "LOCKED":
+        if lock_state != "LOCKED":
             return False
 
         return True
@@ -281,26 +433,76 @@ class ActionGateV0_2:
         """
         intent = inp.action_intent
 
-        if intent == ActionIntent.INTENT_ACTIVATE:
-            if self._state == GateState.ARMED:
-                return (True, ReasonToken.INTENT_ACTIVATE_ACCEPTED)
-            else:
-                return (False, ReasonToken.INTENT_ACTIVATE_REJECTED)
-
-        if intent == ActionIntent.INTENT_HOLD:
-            if self._state in (GateState.ARMED, GateState.ACTIVE):
-                return (True, ReasonToken.INTENT_HOLD_ACCEPTED)
-            else:
-                return (False, ReasonToken.INTENT_HOLD_REJECTED)
-
-        if intent == ActionIntent.INTENT_NONE:
-            if self._config.require_intent_for_active:
-                return (False, ReasonToken.NO_INTENT)
+        if intent == _INTENT_NONE:
+            if self._require_intent:
+                return (False, _RT_NO_INTENT)
             # Legacy v0.1 behavior: allow activate_signal
-            return (inp.activate_signal, ReasonToken.ACTIVATION_TRIGGERED if inp.activate_signal else ReasonToken.NO_INTENT)
-
-        # INTENT_RELEASE handled elsewhere
-        return (False, ReasonToken.INTENT_RELEASE)
+            return (inp.activate_signal, _RT_ACTIVATION_TRIGGERED if inp.activate_signal else _RT_NO_INTENT)
+
+        # INTENT_ACTIVATE / INTENT_HOLD by state; INTENT_RELEASE handled elsewhere
+        return _INTENT_RULES.get((self._state_id, intent), _INTENT_RELEASE_RULE)
+
+    # --- Per-state transition handlers: (inp) -> (decision, reason, intent_accepted) ---
+
+    def _handle_idle(self, inp: GateInput) -> tuple[GateDecision, str, bool]:
+        # IDLE -> OBSERVE on any input
+        self._enter_state(_OBSERVE, _RT_INPUT_RECEIVED, inp.now_ms)
+        return _HOLD_OBSERVE, _RT_OBSERVE_STARTED, False
+
+    def _handle_observe(self, inp: GateInput) -> tuple[GateDecision, str, bool]:
+        # OBSERVE -> ARMED if conditions met
+        if self._check_arm_conditions(inp.coherence_score, inp.lock_state, inp.arm_signal):
+            self._enter_state(_ARMED, _RT_ARMED_CONDITION_MET, inp.now_ms)
+            return _HOLD_OBSERVE, _RT_ARMED_CONDITION_MET, False
+        return _HOLD_OBSERVE, _RT_INSUFFICIENT_CONTEXT, False
+
+    def _handle_armed(self, inp: GateInput) -> tuple[GateDecision, str, bool]:
+        # v0.2: Check intent for activation
+        coherence = inp.coherence_score
+        lock = inp.lock_state
+        intent_allowed, intent_reason = self._check_intent_for_activation(inp)
+        act_ok = self._check_activation_conditions(coherence, lock)  # Evaluated once per tick
+
+        # ARMED -> ACTIVE if activation conditions AND intent allows
+        if act_ok and intent_allowed:
+            self._enter_state(_ACTIVE, intent_reason, inp.now_ms)
+            return _ALLOW_ACTIVE, intent_reason, True
+        # ARMED -> OBSERVE if conditions lost
+        if not self._check_arm_conditions(coherence, lock, inp.arm_signal):
+            self._enter_state(_OBSERVE, _RT_LOCK_LOST, inp.now_ms)
+            return _HOLD_OBSERVE, _RT_LOCK_LOST, False
+        # Stay ARMED, but log intent rejection if applicable
+        if inp.action_intent == _INTENT_ACTIVATE and not act_ok:
+            return _HOLD_OBSERVE, _RT_INTENT_ACTIVATE_REJECTED, False
+        return _HOLD_OBSERVE, _RT_ARMED_CONDITION_MET, False
+
+    def _handle_active(self, inp: GateInput) -> tuple[GateDecision, str, bool]:
+        # v0.2: Check if intent allows staying active
+        intent_allowed, intent_reason = self._check_intent_for_activation(inp)
+
+        # ACTIVE -> OBSERVE if coherence drops
+        if inp.coherence_score < self._coherence_threshold:
+            self._enter_state(_OBSERVE, _RT_COHERENCE_DROP, inp.now_ms)
+            return _HOLD_OBSERVE, _RT_COHERENCE_DROP, False
+        # ACTIVE -> OBSERVE if lock lost
+        if inp.lock_state == "UNLOCKED":
+            self._enter_state(_OBSERVE, _RT_LOCK_LOST, inp.now_ms)
+            return _HOLD_OBSERVE, _RT_LOCK_LOST, False
+        # v0.2: ACTIVE -> OBSERVE if no intent (and required)
+        if not intent_allowed and self._require_intent:
+            self._enter_state(_OBSERVE, intent_reason, inp.now_ms)
+            return _HOLD_OBSERVE, intent_reason, False
+        # Stay ACTIVE
+        return _ALLOW_ACTIVE, _RT_ACTIVATION_TRIGGERED, intent_allowed
+
+    def _handle_fallback(self, inp: GateInput) -> tuple[GateDecision, str, bool]:
+        # FALLBACK -> IDLE on reset (no force_fallback, good coherence, no INTENT_RELEASE)
+        if (not inp.force_fallback and
+            inp.coherence_score >= self._coherence_threshold and
+            inp.action_intent != _INTENT_RELEASE):
+            self._enter_state(_IDLE, _RT_SAFETY_RESET, inp.now_ms)
+            return _HOLD_OBSERVE, _RT_SAFETY_RESET, False
+        return _FORCE_FALLBACK, _RT_SAFETY_RESET, False
 
     def evaluate(self, inp: GateInput) -> GateOutput:
         """
@@ -309,203 +511,198 @@ class ActionGateV0_2:
         Returns GateOutput with new state, decision, and logs.
         """
         self._log_buffer = []  # Reset per evaluation
+        self._log_events.clear()
+
+        now_ms = inp.now_ms
+        intent = inp.action_intent
+        coherence = inp.coherence_score
+        data_age_ms = inp.data_age_ms
 
         # v0.2: Log Action Intent first
-        self._log(_format_log(
-            "ACTION_INTENT",
-            value=inp.action_intent.value,
-            source=inp.intent_source
-        ))
-
-        # Log basis fields
-        basis_fields = {
-            "coherence": f"{inp.coherence_score:.2f}",
-            "lock": inp.lock_state,
-            "data_age_ms": inp.data_age_ms,
-            "rotor": inp.rotor_active,
-        }
-        if inp.fields:
-            basis_fields.update({k: str(v) for k, v in inp.fields.items()})
+        log_enabled = self._log_enabled
+        if log_enabled:
+            self._log(
+                "ACTION_INTENT",
+                value=_INTENT_STR[intent],
+                source=inp.intent_source
+            )
 
-        self._log(_format_log("GATE_BASIS", fields=basis_fields))
+            # Log basis fields (rendered once for GATE_BASIS and GATE_DECISION)
+            if inp.fields:
+                basis_fields = {
+                    "coherence": f"{coherence:.2f}",
+                    "lock": inp.lock_state,
+                    "data_age_ms": data_age_ms,
+                    "rotor": inp.rotor_active,
+                }
+                basis_fields.update({k: str(v) for k, v in inp.fields.items()})
+                basis_text = str(basis_fields)
+            else:
+                basis_text = _fmt_basis(coherence, inp.lock_state, data_age_ms, inp.rotor_active)
 
-        # Track intent acceptance
-        intent_accepted = False
+            self._log_entry("GATE_BASIS", _BASIS_TEMPLATE.format(basis_text))
 
         # === Fallback check (always first, always dominant) ===
-        fallback_reason = self._check_fallback_conditions(inp)
-        if fallback_reason and self._config.fallback_always_allowed:
-            if self._state != GateState.FALLBACK:
-                self._enter_state(GateState.FALLBACK, fallback_reason, inp.now_ms)
-
-            self._log(_format_log(
-                "GATE_FALLBACK",
-                reason=fallback_reason,
-                t_ms=inp.now_ms
-            ))
-            self._log(_format_log(
-                "GATE_DECISION",
-                state=self._state.value,
-                output=GateDecision.FORCE_FALLBACK.value,
-                intent=inp.action_intent.value,
-                basis=basis_fields
-            ))
+        fallback_reason = self._check_fallback_conditions(intent, inp.force_fallback, data_age_ms, coherence)
+        if fallback_reason and self._fallback_allowed:
+            if self._state_id != _FALLBACK:
+                self._enter_state(_FALLBACK, fallback_reason, now_ms)
+
+            if log_enabled:
+                self._log_entry("GATE_FALLBACK", _FALLBACK_TEMPLATE.format(fallback_reason, now_ms))
+                self._log_entry("GATE_DECISION", _DECISION_TEMPLATE.format(
+                    _STATE_STR[self._state_id], _DECISION_STR[_FORCE_FALLBACK],
+                    _INTENT_STR[intent], basis_text))
+            log_entries, log_events = self._log_result()
 
             return GateOutput(
                 state=self._state,
-                decision=GateDecision.FORCE_FALLBACK,
+                decision=_FORCE_FALLBACK,
                 reason=fallback_reason,
-                timestamp_ms=inp.now_ms,
+                timestamp_ms=now_ms,
                 allowed=False,
-                intent_received=inp.action_intent,
+                intent_received=intent,
                 intent_accepted=False,
-                log_entries=list(self._log_buffer)
+                log_entries=log_entries,
+                log_events=log_events
             )
 
         # === State-specific transitions ===
-        decision = GateDecision.HOLD_OBSERVE
-        reason = ReasonToken.INSUFFICIENT_CONTEXT
-
-        if self._state == GateState.IDLE:
-            # IDLE -> OBSERVE on any input
-            self._enter_state(GateState.OBSERVE, ReasonToken.INPUT_RECEIVED, inp.now_ms)
-            reason = ReasonToken.OBSERVE_STARTED
-            decision = GateDecision.HOLD_OBSERVE
-
-        elif self._state == GateState.OBSERVE:
-            # OBSERVE -> ARMED if conditions met
-            if self._check_arm_conditions(inp):
-                self._enter_state(GateState.ARMED, ReasonToken.ARMED_CONDITION_MET, inp.now_ms)
-                reason = ReasonToken.ARMED_CONDITION_MET
-                decision = GateDecision.HOLD_OBSERVE
-            else:
-                reason = ReasonToken.INSUFFICIENT_CONTEXT
-                decision = GateDecision.HOLD_OBSERVE
-
-        elif self._state == GateState.ARMED:
-            # v0.2: Check intent for activation
-            intent_allowed, intent_reason = self._check_intent_for_activation(inp)
-
-            # ARMED -> ACTIVE if activation conditions AND intent allows
-            if self._check_activation_conditions(inp) and intent_allowed:
-                self._enter_state(GateState.ACTIVE, intent_reason, inp.now_ms)
-                reason = intent_reason
-                decision = GateDecision.ALLOW_ACTIVE
-                intent_accepted = True
-            # ARMED -> OBSERVE if conditions lost
-            elif not self._check_arm_conditions(inp):
-                self._enter_state(GateState.OBSERVE, ReasonToken.LOCK_LOST, inp.now_ms)
-                reason = ReasonToken.LOCK_LOST
-                decision = GateDecision.HOLD_OBSERVE
-            else:
-                # Stay ARMED, but log intent rejection if applicable
-                if inp.action_intent == ActionIntent.INTENT_ACTIVATE:
-                    reason = ReasonToken.INTENT_ACTIVATE_REJECTED if not self._check_activation_conditions(inp) else ReasonToken.ARMED_CONDITION_MET
-                else:
-                    reason = ReasonToken.ARMED_CONDITION_MET
-                decision = GateDecision.HOLD_OBSERVE
-
-        elif self._state == GateState.ACTIVE:
-            # v0.2: Check if intent allows staying active
-            intent_allowed, intent_reason = self._check_intent_for_activation(inp)
-
-            # ACTIVE -> OBSERVE if coherence drops
-            if inp.coherence_score < self._config.coherence_threshold:
-                self._enter_state(GateState.OBSERVE, ReasonToken.COHERENCE_DROP, inp.now_ms)
-                reason = ReasonToken.COHERENCE_DROP
-                decision = GateDecision.HOLD_OBSERVE
-            # ACTIVE -> OBSERVE if lock lost
-            elif inp.lock_state == "UNLOCKED":
-                self._enter_state(GateState.OBSERVE, ReasonToken.LOCK_LOST, inp.now_ms)
-                reason = ReasonToken.LOCK_LOST
-                decision = GateDecision.HOLD_OBSERVE
-            # v0.2: ACTIVE -> OBSERVE if no intent (and required)
-            elif not intent_allowed and self._config.require_intent_for_active:
-                self._enter_state(GateState.OBSERVE, intent_reason, inp.now_ms)
-                reason = intent_reason
-                decision = GateDecision.HOLD_OBSERVE
-            else:
-                # Stay ACTIVE
-                reason = ReasonToken.ACTIVATION_TRIGGERED
-                decision = GateDecision.ALLOW_ACTIVE
-                intent_accepted = intent_allowed
-
-        elif self._state == GateState.FALLBACK:
-            # FALLBACK -> IDLE on reset (no force_fallback, good coherence, no INTENT_RELEASE)
-            if (not inp.force_fallback and
-                inp.coherence_score >= self._config.coherence_threshold and
-                inp.action_intent != ActionIntent.INTENT_RELEASE):
-                self._enter_state(GateState.IDLE, ReasonToken.SAFETY_RESET, inp.now_ms)
-                reason = ReasonToken.SAFETY_RESET
-                decision = GateDecision.HOLD_OBSERVE
-            else:
-                reason = ReasonToken.SAFETY_RESET
-                decision = GateDecision.FORCE_FALLBACK
+        decision, reason, intent_accepted = self._dispatch[self._state_id](inp)
 
         # Log decision with intent (v0.2)
-        self._log(_format_log(
-            "GATE_DECISION",
-            state=self._state.value,
-            output=decision.value,
-            intent=inp.action_intent.value,
-            basis=basis_fields
-        ))
+        if log_enabled:
+            self._log_entry("GATE_DECISION", _DECISION_TEMPLATE.format(
+                _STATE_STR[self._state_id], _DECISION_STR[decision], _INTENT_STR[intent], basis_text))
+        log_entries, log_events = self._log_result()
 
         return GateOutput(
             state=self._state,
             decision=decision,
             reason=reason,
-            timestamp_ms=inp.now_ms,
-            allowed=(decision == GateDecision.ALLOW_ACTIVE),
-            intent_received=inp.action_intent,
+            timestamp_ms=now_ms,
+            allowed=(decision == _ALLOW_ACTIVE),
+            intent_received=intent,
             intent_accepted=intent_accepted,
-            log_entries=list(self._log_buffer)
+            log_entries=log_entries,
+            log_events=log_events
         )
 
+    def evaluate_many(self, now_ms, coherence_score, lock_state, data_age_ms, action_intent,
+                      arm_signal=None, activate_signal=None, force_fallback=None):
+        """
+        Evaluate a whole replay in one call (offline use; requires NumPy).
+
+        Structure-of-arrays input: one array per GateInput field, one row per
+        tick. `action_intent` holds ActionIntent codes (declaration order,
+        INTENT_NONE = 0); a code outside the enum raises ValueError. Omitted
+        signal arrays default to all-False.
+
+        Same transitions as calling evaluate() row by row, but nothing is
+        logged. Returns (states, decisions): int8 arrays of GateState /
+        GateDecision codes (declaration order) after each row.
+        """
+        if np is None:
+            raise ImportError("evaluate_many() requires NumPy")
+
+        now_ms = np.asarray(now_ms, dtype=np.int64)
+        n = len(now_ms)
+        coherence_score = np.asarray(coherence_score, dtype=np.float64)
+        lock_state = np.asarray(lock_state, dtype=str)
+        data_age_ms = np.asarray(data_age_ms, dtype=np.int64)
+        action_intent = np.asarray(action_intent, dtype=np.int64)
+        if not ((action_intent >= 0) & (action_intent < len(_INTENTS))).all():
+            raise ValueError(f"action_intent codes must be in 0..{len(_INTENTS) - 1}")
+        action_intent = action_intent.astype(np.int8)
+        no_signal = np.zeros(n, dtype=bool)
+        arm_signal = no_signal if arm_signal is None else np.asarray(arm_signal, dtype=bool)
+        activate_signal = no_signal if activate_signal is None else np.asarray(activate_signal, dtype=bool)
+        force_fallback = no_signal if force_fallback is None else np.asarray(force_fallback, dtype=bool)
+
+        # Fallback is input-only: decide it for all rows at once
+        if self._fallback_allowed:
+            fallback_mask = ((action_intent == _INTENTS.index(_INTENT_RELEASE))
+                             | force_fallback
+                             | (data_age_ms > self._stale_threshold_ms)
+                             | (coherence_score < _FALLBACK_COHERENCE_MIN))
+        else:
+            fallback_mask = no_signal
+
+        states = np.empty(n, dtype=np.int8)
+        decisions = np.empty(n, dtype=np.int8)
+        log_enabled = self._log_enabled
+        self._log_enabled = False
+        try:
+            # Transitions depend on the previous state: sequential scan
+            for i in range(n):
+                t = int(now_ms[i])
+                intent = _INTENTS[action_intent[i]]
+                if fallback_mask[i]:
+                    if self._state_id != _FALLBACK:
+                        reason = self._check_fallback_conditions(
+                            intent, bool(force_fallback[i]), int(data_age_ms[i]), float(coherence_score[i]))
+                        self._enter_state(_FALLBACK, reason, t)
+                    decision = _FORCE_FALLBACK
+                else:
+                    inp = GateInput(
+                        now_ms=t,
+                        coherence_score=float(coherence_score[i]),
+                        lock_state=str(lock_state[i]),
+                        data_age_ms=int(data_age_ms[i]),
+                        force_fallback=bool(force_fallback[i]),
+                        arm_signal=bool(arm_signal[i]),
+                        activate_signal=bool(activate_signal[i]),
+                        action_intent=intent,
+                    )
+                    decision = self._dispatch[self._state_id](inp)[0]
+                states[i] = self._state_id
+                decisions[i] = _DECISION_CODE[decision]
+        finally:
+            self._log_enabled = log_enabled
+        return states, decisions
+
     def force_fallback(self, now_ms: int, reason: str = None) -> GateOutput:
         """
         Force immediate transition to FALLBACK state.
         Always allowed, always succeeds.
         """
-        reason = reason or ReasonToken.MANUAL_FALLBACK
+        reason = reason or _RT_MANUAL_FALLBACK
+        # Entries carry over from the last tick, but that list now belongs to
+        # the previous GateOutput: extend a copy.
+        if self._collect_log_entries:
+            self._log_buffer = self._log_buffer[:]
 
-        if self._state != GateState.FALLBACK:
-            self._enter_state(GateState.FALLBACK, reason, now_ms)
+        if self._state_id != _FALLBACK:
+            self._enter_state(_FALLBACK, reason, now_ms)
 
-        self._log(_format_log(
-            "GATE_FALLBACK",
-            reason=reason,
-            t_ms=now_ms
-        ))
-        self._log(_format_log(
-            "GATE_DECISION",
-            state=self._state.value,
-            output=GateDecision.FORCE_FALLBACK.value,
-            intent=ActionIntent.INTENT_NONE.value,
-            basis={}
-        ))
+        if self._log_enabled:
+            self._log_entry("GATE_FALLBACK", _FALLBACK_TEMPLATE.format(reason, now_ms))
+            self._log_entry("GATE_DECISION", _FORCE_FALLBACK_DECISION)
+        log_entries, log_events = self._log_result()
 
         return GateOutput(
             state=self._state,
-            decision=GateDecision.FORCE_FALLBACK,
+            decision=_FORCE_FALLBACK,
             reason=reason,
             timestamp_ms=now_ms,
             allowed=False,
-            intent_received=ActionIntent.INTENT_NONE,
+            intent_received=_INTENT_NONE,
             intent_accepted=False,
-            log_entries=list(self._log_buffer)
+            log_entries=log_entries,
+            log_events=log_events
         )
 
     def reset(self, now_ms: int) -> None:
         """Reset gate to IDLE state."""
         self._log_buffer = []
-        self._enter_state(GateState.IDLE, ReasonToken.INIT_COMPLETE, now_ms)
+        self._log_events.clear()
+        self._enter_state(_IDLE, _RT_INIT_COMPLETE, now_ms)
 
     def get_debug_state(self) -> Dict[str, Any]:
         """Get debug state snapshot."""
         return {
             "version": self.VERSION,
-            "state": self._state.value,
+            "state": _STATE_STR[self._state_id],
             "transition_count": self._transition_count,
             "last_transition_ms": self._last_transition_ms,
         }
@@ -21,9 +21,16 @@ from dataclasses import dataclass, field
 from typing import Optional, Dict, Any, Tuple, Set
 from collections import deque, Counter
 from enum import Enum
+from types import MethodType
 import math
+import sys
 
 INF = float('inf')
+_exp = math.exp  # per-tick decays: one global load instead of module + attribute
+
+def _intern(x):
+    """sys.intern() for exact str; str subclasses (e.g. numpy.str_) are kept as-is."""
+    return sys.intern(x) if type(x) is str else x
 
 class AwState(Enum):
     STILL = "STILL"
@@ -74,9 +81,9 @@ class L1Reason(Enum):
     HARD_RESET_GAP = "HARD_RESET_GAP"
     INIT = "INIT"
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class L1Config:
-    """Configuration for L1 PhysicalActivity + OriginTracker v0.4.5."""
+    """Configuration for L1 PhysicalActivity + OriginTracker v0.4.5 (immutable; derive variants with dataclasses.replace)."""
     gap_ms: float = 500.0
     activity_threshold_low: float = 1.0
     activity_threshold_high: float = 5.0
@@ -87,6 +94,14 @@ class L1Config:
     encoder_tau_s: float = 0.6
     hard_reset_s: float = 1.5
     activity_decay_rate: float = 5.0
+    # L1 state hysteresis (defaults: off). While SCRAPE the high activity threshold is
+    # A1*(1-h), while STILL activity must reach A0*(1+h); while DISPLACEMENT/MOVING the
+    # displacement threshold is D0*(1-hd). A new L1 state is committed only after it was
+    # computed on this many consecutive updates (up = higher L1State, down = lower).
+    activity_hysteresis: float = 0.0
+    displacement_hysteresis: float = 0.0
+    min_consecutive_up: int = 1
+    min_consecutive_down: int = 1
     # MDI v0.4.5
     mdi_mode: str = "C"
     mdi_win_ms: float = 200.0
@@ -129,14 +144,47 @@ class L1Config:
     noise_gap_s: float = 0.50
     movement_hold_s: float = 0.25
     activity_reset_a0: float = 0.20
+    # Idle-tick coalescing (0 = off): update() calls within this interval of the last
+    # evaluated one that bring no new cycles, events, pool data or L2 inputs return the
+    # previous snapshot unchanged; the next evaluated update() covers the whole interval.
+    # Applies to update() only (replay() evaluates every sample).
+    min_update_interval_s: float = 0.0
+    # Derived in __post_init__ (per-tick constants)
+    _mdi_mode_upper: str = field(init=False, repr=False, compare=False)
+    _pool_win_s: float = field(init=False, repr=False, compare=False)
+    _mdi_win_s: float = field(init=False, repr=False, compare=False)
+    _mdi_flipflop_window_s: float = field(init=False, repr=False, compare=False)
+    _gap_s: float = field(init=False, repr=False, compare=False)
+    _act_gain_still: float = field(init=False, repr=False, compare=False)
+    _act_gain_scrape: float = field(init=False, repr=False, compare=False)
+    _disp_gain_moving: float = field(init=False, repr=False, compare=False)
+    _hysteresis: bool = field(init=False, repr=False, compare=False)
+    _lock_states_moving: frozenset = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        for name in ("activity_hysteresis", "displacement_hysteresis"):
+            if not 0.0 <= getattr(self, name) < 1.0:
+                raise ValueError(f"{name} must be in [0, 1), got {getattr(self, name)!r}")
+        object.__setattr__(self, "_mdi_mode_upper", self.mdi_mode.upper())
+        object.__setattr__(self, "_pool_win_s", self.pool_win_ms/1000)
+        object.__setattr__(self, "_mdi_win_s", self.mdi_win_ms/1000)
+        object.__setattr__(self, "_mdi_flipflop_window_s", self.mdi_flipflop_window_ms/1000)
+        object.__setattr__(self, "_gap_s", self.gap_ms/1000)
+        # Hysteresis as input gains: act*g >= A  <=>  act >= A/g
+        object.__setattr__(self, "_act_gain_still", 1/(1 + self.activity_hysteresis))
+        object.__setattr__(self, "_act_gain_scrape", 1/(1 - self.activity_hysteresis))
+        object.__setattr__(self, "_disp_gain_moving", 1/(1 - self.displacement_hysteresis))
+        object.__setattr__(self, "_hysteresis", bool(self.activity_hysteresis or self.displacement_hysteresis
+                                                     or self.min_consecutive_up > 1 or self.min_consecutive_down > 1))
+        # Interned set: one cached-hash probe, matched by identity against update()'s interned lock_state
+        object.__setattr__(self, "_lock_states_moving", frozenset(map(_intern, self.lock_states_for_moving)))
 
-@dataclass
+@dataclass(slots=True)
 class L1Snapshot:
     """Snapshot of L1 state + OriginTracker v0.4.5."""
     state: L1State
     reason: L1Reason
     theta_hat_rot: float = 0.0
-    theta_hat_deg: float = 0.0
     delta_theta_deg_signed: float = 0.0
     activity_score: float = 0.0
     direction_effective: str = "UNDECIDED"
@@ -192,24 +240,175 @@ class L1Snapshot:
     aw_state: AwState = AwState.STILL
     aw_reason: AwReason = AwReason.INIT
 
+    @property
+    def theta_hat_deg(self) -> float:
+        """theta_hat_rot in degrees [0, 360), derived on read (not stored per tick)."""
+        return (self.theta_hat_rot * 360) % 360
+
 def wrap_deg_signed(x: float) -> float:
     return ((x + 180.0) % 360.0) - 180.0
 
+def _l1_state_rule(gap, disp, locked, dir_conf, act_high, act_low):
+    """L1 decision ladder on its six boolean tests (gap timeout, disp >= d0, lock moving, dir conf, act >= high/low)."""
+    if gap: return L1State.STILL, L1Reason.STILL_GAP_TIMEOUT
+    if not act_low and not disp: return L1State.STILL, L1Reason.STILL_LOW_ACTIVITY
+    if disp:
+        if locked: return L1State.MOVING, L1Reason.MOVING_LOCKED
+        if dir_conf: return L1State.MOVING, L1Reason.MOVING_STABLE_DIR
+        return L1State.DISPLACEMENT, L1Reason.DISP_ABOVE_D0
+    if act_high: return L1State.SCRAPE, L1Reason.SCRAPE_HIGH_ACTIVITY
+    if act_low: return L1State.FEELING, L1Reason.FEELING_ACTIVITY_NO_DISP
+    return L1State.STILL, L1Reason.STILL_LOW_ACTIVITY
+
+# (L1State, L1Reason) tiers of the ladder, derived from _l1_state_rule: the gap timeout
+# decides alone; with disp >= d0 only (lock moving, dir conf) matter, indexed lock*2 + conf;
+# otherwise only (act >= high, act >= low), indexed high*2 + low.
+_L1_GAP_RESULT = _l1_state_rule(1, 0, 0, 0, 0, 0)
+_L1_DISP_TABLE = tuple(_l1_state_rule(0, 1, i >> 1, i & 1, 0, 0) for i in range(4))
+_L1_ACT_TABLE = tuple(_l1_state_rule(0, 0, 0, 0, i >> 1, i & 1) for i in range(4))
+
+# L1State order for hysteresis up/down (also the replay kernel's state codes)
+_L1_STATE_RANK = {s: i for i, s in enumerate(L1State)}
+
+# Member groups tested per tick (tuples: `in` matches by identity before calling Enum.__eq__/__hash__)
+_AW_QUIET = (AwState.STILL, AwState.NOISE)
+_AW_PRE_CANDIDATE = (AwState.STILL, AwState.NOISE, AwState.PRE_MOVEMENT)
+_MDI_DROP_REASONS = (AwReason.MDI_LATCH_DROPPED, AwReason.MDI_TRIGGER_A_DROPPED)
+
+# _reset_origin() reason -> AwReason (anything else, e.g. HARD_RESET, maps to INIT)
+_RESET_AW_REASON = {"STOP_GAP_TIMEOUT": AwReason.STOP_GAP_TIMEOUT, "NO_DISP_ACTIVE": AwReason.NO_DISP_ACTIVE,
+                    "MDI_TREMOR": AwReason.MDI_TREMOR, "MDI_HOLD_TIMEOUT": AwReason.MDI_HOLD_TIMEOUT,
+                    "MDI_LATCH_DROPPED": AwReason.MDI_LATCH_DROPPED, "CANDIDATE_DROPPED": AwReason.CANDIDATE_DROPPED}
+
+def _specialize_l1_state(cfg: L1Config):
+    """_compute_l1_state with the thresholds of `cfg` captured as closure constants (cfg must stay fixed)."""
+    gap_s, d0 = cfg._gap_s, cfg.displacement_threshold
+    conf_min = cfg.direction_conf_threshold
+    act_high, act_low = cfg.activity_threshold_high, cfg.activity_threshold_low
+    gap_result, disp_table, act_table = _L1_GAP_RESULT, _L1_DISP_TABLE, _L1_ACT_TABLE
+    def _compute_l1_state(self, act, disp, age_C, age_E):
+        if age_C >= gap_s and age_E >= gap_s: return gap_result
+        if disp >= d0: return disp_table[(self._lock_moving << 1) | (self._direction_conf >= conf_min)]
+        return act_table[((act >= act_high) << 1) | (act >= act_low)]
+    return _compute_l1_state
+
+class _PoolWindow:
+    """
+    Sliding time window of record_pool() entries with running aggregates.
+
+    Keeps what _compute_pool_stats / _compute_mdi_stats used to rescan per tick:
+    entry count, valid (pool 0/1/2) count, unique valid pools, per-sensor pool
+    changes (sensor 0 vs the rest) and sensor switches between neighbours.
+    append() and expire() update them in O(1) per entry. If timestamps ever
+    arrive out of order, entries older than the cutoff can sit behind newer ones;
+    stats() then falls back to the original filtering scan until the window is
+    sorted again.
+    """
+    __slots__ = ("_q", "n", "valid", "changes", "switches", "_unique", "_last_valid", "_inversions")
+    
+    def __init__(self):
+        self._q: deque = deque()  # entries [t, sensor, pool, chg, succ]; succ = next valid entry of the sensor
+        self.n = self.valid = self.changes = self.switches = 0
+        self._unique = Counter()
+        self._last_valid = [None, None]  # newest valid entry per sensor side (0, other)
+        self._inversions = 0  # adjacent pairs with t decreasing
+    
+    def __len__(self) -> int: return self.n
+    
+    def append(self, t: float, sensor: int, pool: Optional[int]) -> None:
+        q = self._q
+        entry = [t, sensor, pool, 0, None]
+        if q:
+            last = q[-1]
+            if last[1] != sensor: self.switches += 1
+            if t < last[0]: self._inversions += 1
+        if pool in (0,1,2):
+            self.valid += 1
+            self._unique[pool] += 1
+            side = 0 if sensor == 0 else 1
+            prev = self._last_valid[side]
+            if prev is not None:
+                prev[4] = entry
+                if prev[2] != pool: entry[3] = 1; self.changes += 1
+            self._last_valid[side] = entry
+        q.append(entry)
+        self.n += 1
+    
+    def expire(self, cutoff: float) -> None:
+        """Drop entries older than cutoff from the left (the window's time order)."""
+        q = self._q
+        while q and q[0][0] < cutoff:
+            t, sensor, pool, _, succ = q.popleft()
+            self.n -= 1
+            if q:
+                head = q[0]
+                if head[1] != sensor: self.switches -= 1
+                if head[0] < t: self._inversions -= 1
+            if pool in (0,1,2):
+                self.valid -= 1
+                u = self._unique
+                u[pool] -= 1
+                if not u[pool]: del u[pool]
+                if succ is not None:  # successor no longer has an in-window predecessor
+                    self.changes -= succ[3]; succ[3] = 0
+                else:
+                    self._last_valid[0 if sensor == 0 else 1] = None
+    
+    def stats(self, cutoff: float):
+        """(entries, valid, changes, switches, unique pools) over entries with t >= cutoff."""
+        if not self._inversions:  # sorted: expire(cutoff) left nothing older behind
+            return self.n, self.valid, self.changes, self.switches, set(self._unique)
+        n, changes, valid, switches = 0, 0, 0, 0
+        unique: Set[int] = set()
+        pA = pB = ps = None
+        for t, s, p, _, _ in self._q:
+            if t < cutoff: continue
+            n += 1
+            if p in (0,1,2):
+                valid += 1
+                unique.add(p)
+                if s == 0:
+                    if pA is not None and pA != p: changes += 1
+                    pA = p
+                else:
+                    if pB is not None and pB != p: changes += 1
+                    pB = p
+            if ps is not None and ps != s: switches += 1
+            ps = s
+        return n, valid, changes, switches, unique
+
+def _load_activity_step():
+    """_l1_kernels.l1_activity_step if Numba (and NumPy) are installed, else None."""
+    try:
+        try:
+            from . import _l1_kernels
+        except ImportError:  # stand-alone fallback
+            import _l1_kernels  # type: ignore
+    except ImportError:  # no NumPy
+        return None
+    return _l1_kernels.l1_activity_step if _l1_kernels.NUMBA_AVAILABLE else None
+
 class L1PhysicalActivity:
     """L1 PhysicalActivity Layer v1.1 (OriginTracker v0.4.5 + MDI modes)."""
+    _activity_step = None  # compiled activity/encoder step, bound by specialized() when Numba is available
     
     def __init__(self, config: L1Config = None):
         self.config = config or L1Config()
         self._state, self._reason = L1State.STILL, L1Reason.INIT
+        self._pending_state, self._pending_count = None, 0  # L1 state awaiting confirmation (hysteresis)
         self._theta_hat_rot = self._prev_theta_hat_rot = 0.0
         self._t_last_update = self._t_last_cycle_s = self._t_last_event_s = None
+        self._last_snapshot: Optional[L1Snapshot] = None  # returned for coalesced idle ticks
         self._prev_cycles_total = 0.0
         self._total_events = self._events_without_cycles = 0
         self._activity_score = self._encoder_conf = 0.0
+        self._decay_dt, self._decay_act, self._decay_enc = 0.0, 1.0, 1.0  # decay factors of the last dt_s
         self._direction_effective, self._direction_conf, self._lock_state = "UNDECIDED", 0.0, "UNLOCKED"
+        self._lock_moving = self._lock_state in self.config._lock_states_moving  # refreshed when lock_state changes
         self._to_pool_hist = Counter()
-        self._pool_window: deque = deque()
-        self._mdi_window: deque = deque()
+        self._to_pool_hist_snap: Optional[Dict[str, int]] = None  # dict copy for snapshots; None = stale
+        self._pool_window = _PoolWindow()
+        self._mdi_window = _PoolWindow()
         self._mdi_micro_acc = self._mdi_tremor_score = self._mdi_conf_acc = 0.0
         self._mdi_conf_last_update_s = None
         self._mdi_last_pool_A = self._mdi_last_pool_B = self._mdi_last_sensor = None
@@ -239,17 +438,25 @@ class L1PhysicalActivity:
     def state(self) -> L1State: return self._state
     @property
     def aw_state(self) -> AwState: return self._aw_state
+    @property
+    def snapshot(self) -> Optional[L1Snapshot]:
+        """Snapshot of the last update() (None before the first one or after update_inplace())."""
+        return self._last_snapshot
     
     def record_pool(self, to_pool, sensor: int, t_s: float = None) -> None:
         cfg = self.config
         now_s = t_s or (self._t_last_update or 0.0)
-        key = "None" if to_pool is None else (str(to_pool) if to_pool in (0,1,2,3) else "other")
-        pool_val = int(to_pool) if to_pool in (0,1,2,3) else None
+        if to_pool in (0,1,2,3): key, pool_val = str(to_pool), int(to_pool)
+        else: key, pool_val = ("None" if to_pool is None else "other"), None
         self._to_pool_hist[key] += 1
-        self._pool_window.append((now_s, sensor, pool_val))
-        while self._pool_window and self._pool_window[0][0] < now_s - cfg.pool_win_ms/1000: self._pool_window.popleft()
-        self._mdi_window.append((now_s, sensor, pool_val))
-        while self._mdi_window and self._mdi_window[0][0] < now_s - cfg.mdi_win_ms/1000: self._mdi_window.popleft()
+        self._to_pool_hist_snap = None
+        # Per-event path: the windows keep their stats incrementally (see _PoolWindow)
+        win = self._pool_window
+        win.append(now_s, sensor, pool_val)
+        win.expire(now_s - cfg._pool_win_s)
+        win = self._mdi_window
+        win.append(now_s, sensor, pool_val)
+        win.expire(now_s - cfg._mdi_win_s)
         if pool_val in (0,1,2): self._process_mdi_step(now_s, sensor, pool_val)
     
     def _process_mdi_step(self, t_s: float, sensor: int, pool_val: int) -> None:
@@ -262,36 +469,29 @@ class L1PhysicalActivity:
             self._mdi_pool_order.append((pool_val, sensor))
             if self._mdi_latch_set: self._mdi_changes_since_latch += 1
             if self._mdi_trigger_A_t0_s is not None: self._mdi_changes_since_trigger_A += 1
-            self._mdi_flipflop_buffer.append((t_s, sensor, pool_val))
-            cutoff = t_s - cfg.mdi_flipflop_window_ms/1000
-            recent = [p for tt,_,p in self._mdi_flipflop_buffer if tt >= cutoff]
-            if len(recent) >= 3 and recent[-3] == recent[-1] != recent[-2]:
+            self._mdi_flipflop_buffer.append((t_s, pool_val))  # (t, pool): all _is_flipflop reads
+            if self._is_flipflop(t_s - cfg._mdi_flipflop_window_s):
                 step, self._mdi_tremor_score = -0.5, min(1.0, self._mdi_tremor_score + 0.15)
             self._mdi_micro_acc = max(0, min(cfg.mdi_micro_acc_max, self._mdi_micro_acc + step))
             if self._micro_t0_s is None and self._mdi_micro_acc >= 1: self._micro_t0_s = t_s
         self._mdi_last_sensor = sensor
         self._mdi_tremor_score = max(0, self._mdi_tremor_score - 0.02)
     
+    def _is_flipflop(self, cutoff: float) -> bool:
+        """Last three in-window pools (t >= cutoff) read A-B-A; scans back only until three are found."""
+        last = []
+        for tt, p in reversed(self._mdi_flipflop_buffer):
+            if tt >= cutoff:
+                last.append(p)
+                if len(last) == 3: return last[2] == last[0] != last[1]
+        return False
+    
     def _compute_mdi_stats(self, now_s: float):
         cfg = self.config
-        cutoff = now_s - cfg.mdi_win_ms/1000
-        ev_win, changes, valid_count, switches = 0, 0, 0, 0
-        unique: Set[int] = set()
-        pA = pB = ps = None
-        for t, s, p in self._mdi_window:
-            if t < cutoff: continue
-            ev_win += 1
-            if p in (0,1,2):
-                valid_count += 1
-                unique.add(p)
-                if s == 0:
-                    if pA is not None and pA != p: changes += 1
-                    pA = p
-                else:
-                    if pB is not None and pB != p: changes += 1
-                    pB = p
-            if ps is not None and ps != s: switches += 1
-            ps = s
+        cutoff = now_s - cfg._mdi_win_s
+        win = self._mdi_window
+        win.expire(cutoff)
+        ev_win, valid_count, changes, switches, unique = win.stats(cutoff)
         vr = valid_count/ev_win if ev_win else 0
         ar = switches/max(1, ev_win-1) if ev_win > 1 else 0
         return ev_win, changes, unique, vr, ar, self._mdi_tremor_score
@@ -304,7 +504,7 @@ class L1PhysicalActivity:
         if self._mdi_conf_last_update_s is None: self._mdi_conf_acc = conf
         else:
             dt = now_s - self._mdi_conf_last_update_s
-            a = 1 - math.exp(-dt/cfg.mdi_conf_tau_s) if cfg.mdi_conf_tau_s > 0 else 1
+            a = 1 - _exp(-dt/cfg.mdi_conf_tau_s) if cfg.mdi_conf_tau_s > 0 else 1
             self._mdi_conf_acc = (1-a)*self._mdi_conf_acc + a*conf
         self._mdi_conf_last_update_s = now_s
         return self._mdi_conf_acc
@@ -318,9 +518,11 @@ class L1PhysicalActivity:
     
     def _infer_dir(self):
         if len(self._mdi_pool_order) < 3: return "UNDECIDED"
-        pools = [p for p,_ in list(self._mdi_pool_order)[-6:]]
-        ns = sum(1 for i in range(len(pools)-1) if pools[i]==1 and pools[i+1]==2)
-        sn = sum(1 for i in range(len(pools)-1) if pools[i]==2 and pools[i+1]==1)
+        pools = [p for p,_ in self._mdi_pool_order]  # maxlen=6: already the last six
+        ns = sn = 0
+        for a, b in zip(pools, pools[1:]):  # one pass over adjacent pairs
+            if a == 1 and b == 2: ns += 1
+            elif a == 2 and b == 1: sn += 1
         if ns > sn+1: return "CW"
         if sn > ns+1: return "CCW"
         return "UNDECIDED"
@@ -375,7 +577,7 @@ class L1PhysicalActivity:
         return False, AwReason.NOISE_ACC_BELOW_THRESHOLD
     
     def _apply_mdi_mode(self, now_s, ev_win, chg, uniq, vr, conf, conf_acc, trem, micro_deg):
-        mode = self.config.mdi_mode.upper()
+        mode = self.config._mdi_mode_upper
         conf_used = conf_acc if conf_acc > 0 else conf
         if mode == "A": return self._apply_mode_A(now_s, chg, vr, conf_used, trem, micro_deg)
         if mode == "B": return self._apply_mode_B(now_s, chg, vr, conf_used, trem, micro_deg)
@@ -383,23 +585,10 @@ class L1PhysicalActivity:
     
     def _compute_pool_stats(self, now_s):
         cfg = self.config
-        cutoff = now_s - cfg.pool_win_ms/1000
-        chg, valid = 0, 0
-        unique: Set[int] = set()
-        pA = pB = None
-        total = 0
-        for t, s, p in self._pool_window:
-            if t < cutoff: continue
-            total += 1
-            if p in (0,1,2):
-                valid += 1
-                unique.add(p)
-                if s == 0:
-                    if pA is not None and pA != p: chg += 1
-                    pA = p
-                else:
-                    if pB is not None and pB != p: chg += 1
-                    pB = p
+        cutoff = now_s - cfg._pool_win_s
+        win = self._pool_window
+        win.expire(cutoff)
+        total, valid, chg, _, unique = win.stats(cutoff)
         vr = valid/total if total else 0
         return chg, unique, vr
     
@@ -425,14 +614,25 @@ class L1PhysicalActivity:
         self._early_dir = "UNDECIDED"
         self._commit_horizon_start_s, self._commit_horizon_max_acc = None, 0
         self._aw_state = AwState.NOISE if keep_tactile and self._activity_score >= cfg.activity_threshold_low else AwState.STILL
-        rmap = {"STOP_GAP_TIMEOUT": AwReason.STOP_GAP_TIMEOUT, "NO_DISP_ACTIVE": AwReason.NO_DISP_ACTIVE,
-                "MDI_TREMOR": AwReason.MDI_TREMOR, "MDI_HOLD_TIMEOUT": AwReason.MDI_HOLD_TIMEOUT,
-                "MDI_LATCH_DROPPED": AwReason.MDI_LATCH_DROPPED, "CANDIDATE_DROPPED": AwReason.CANDIDATE_DROPPED}
-        self._aw_reason = rmap.get(reason, AwReason.INIT)
+        self._aw_reason = _RESET_AW_REASON.get(reason, AwReason.INIT)
     
     def update(self, wall_time: float, cycles_physical_total: float, events_this_batch: int = 0,
-               direction_conf: float = None, lock_state: str = None, direction_effective: str = None, **kw) -> L1Snapshot:
+               direction_conf: float = None, lock_state: str = None, direction_effective: str = None,
+               snapshot: bool = True, record_to: Optional["L1HistoryRing"] = None, **kw) -> Optional[L1Snapshot]:
+        """
+        Advance L1 by one tick; snapshot=False skips building the L1Snapshot and returns None.
+
+        record_to: L1HistoryRing that receives this tick's row (coalesced idle ticks are not recorded).
+        """
         cfg = self.config
+        if (cfg.min_update_interval_s and self._last_snapshot is not None and not events_this_batch
+                and cycles_physical_total == self._prev_cycles_total
+                and wall_time - self._t_last_update < cfg.min_update_interval_s
+                and self._to_pool_hist_snap is not None  # no record_pool() since the last snapshot
+                and (direction_conf is None or direction_conf == self._direction_conf)
+                and (lock_state is None or lock_state == self._lock_state)
+                and (direction_effective is None or direction_effective == self._direction_effective)):
+            return self._last_snapshot if snapshot else None
         now_s = wall_time
         dt_s = (now_s - self._t_last_update) if self._t_last_update else 0
         self._t_last_update = now_s
@@ -444,7 +644,6 @@ class L1PhysicalActivity:
         self._prev_theta_hat_rot = self._theta_hat_rot
         self._theta_hat_rot = cycles_physical_total / cfg.cycles_per_rot
         dtheta = wrap_deg_signed((self._theta_hat_rot - self._prev_theta_hat_rot) * 360)
-        theta_deg = (self._theta_hat_rot * 360) % 360
         
         if delta_cycles > 0: self._t_last_cycle_s, self._events_without_cycles = now_s, 0
         if events_this_batch > 0:
@@ -453,21 +652,40 @@ class L1PhysicalActivity:
         
         ageE = INF if self._t_last_event_s is None else now_s - self._t_last_event_s
         ageC = INF if self._t_last_cycle_s is None else now_s - self._t_last_cycle_s
-        l2_stale = ageC >= cfg.stop_gap_s
+        stop_gap_s, a0_reset, tremor_max = cfg.stop_gap_s, cfg.activity_reset_a0, cfg.mdi_tremor_max
+        l2_stale = ageC >= stop_gap_s
         
         if direction_conf is not None: self._direction_conf = direction_conf
-        if lock_state is not None: self._lock_state = lock_state
-        if direction_effective is not None: self._direction_effective = direction_effective
+        # L2 strings interned once per change; later compares hit the identity fast path
+        if lock_state is not None and lock_state is not self._lock_state:
+            self._lock_state = lock_state = _intern(lock_state)
+            self._lock_moving = lock_state in cfg._lock_states_moving  # read by _compute_l1_state and _compute_aw
+        if direction_effective is not None and direction_effective is not self._direction_effective:
+            self._direction_effective = _intern(direction_effective)
         
-        if dt_s > 0: self._activity_score *= math.exp(-dt_s * cfg.activity_decay_rate)
-        self._activity_score += events_this_batch
-        if dt_s > 0: self._encoder_conf *= math.exp(-dt_s / cfg.encoder_tau_s)
-        if delta_cycles > 0: self._encoder_conf = min(1, self._encoder_conf + 0.15)
-        elif events_this_batch > 0: self._encoder_conf = min(1, self._encoder_conf + 0.05)
-        self._encoder_conf = max(0, min(1, self._encoder_conf))
+        # Activity / encoder recurrences on locals; act is read by every check below
+        if self._activity_step is not None:
+            act, enc = self._activity_step(dt_s, self._activity_score, self._encoder_conf, delta_cycles > 0,
+                                           events_this_batch, cfg.activity_decay_rate, cfg.encoder_tau_s)
+        else:
+            act, enc = self._activity_score, self._encoder_conf
+            if dt_s > 0:  # Time-based decays, one elapsed-time test
+                if dt_s != self._decay_dt:  # periodic ticks repeat dt_s exactly: reuse the factors
+                    self._decay_dt = dt_s
+                    self._decay_act, self._decay_enc = _exp(-dt_s * cfg.activity_decay_rate), _exp(-dt_s / cfg.encoder_tau_s)
+                act *= self._decay_act
+                enc *= self._decay_enc
+            act += events_this_batch
+            if delta_cycles > 0: enc += 0.15
+            elif events_this_batch > 0: enc += 0.05
+            enc = (enc if enc > 0 else 0) if enc < 1 else 1  # max(0, min(1, enc)) without the builtin calls
+        self._activity_score, self._encoder_conf = act, enc
         
-        gap_ms_C, gap_ms_E = ageC*1000 if ageC != INF else INF, ageE*1000 if ageE != INF else INF
-        self._state, self._reason = self._compute_l1_state(self._activity_score, abs(dtheta/360), gap_ms_C, gap_ms_E)
+        # Ages in seconds as computed above (INF before the first cycle / event)
+        if cfg._hysteresis:
+            self._update_l1_state_hysteresis(abs(dtheta/360), ageC, ageE)
+        else:
+            self._state, self._reason = self._compute_l1_state(act, abs(dtheta/360), ageC, ageE)
         
         pool_chg, pool_uniq, pool_vr = self._compute_pool_stats(now_s)
         ev_win, mdi_chg, mdi_uniq, mdi_vr, mdi_ar, mdi_trem = self._compute_mdi_stats(now_s)
@@ -479,38 +697,38 @@ class L1PhysicalActivity:
         
         # v0.4.5: Evaluate MDI FIRST to check if we should skip gap reset
         mdi_triggered, mdi_reason = False, AwReason.NOISE_ACC_BELOW_THRESHOLD
-        if mdi_trem <= cfg.mdi_tremor_max:  # only if not tremoring
+        if mdi_trem <= tremor_max:  # only if not tremoring
             mdi_triggered, mdi_reason = self._apply_mdi_mode(now_s, ev_win, mdi_chg, mdi_uniq, mdi_vr, mdi_conf, mdi_conf_acc, mdi_trem, mdi_deg)
         
         # MDI is "active" if latched or triggered
-        mdi_active = mdi_triggered or self._mdi_latch_set or self._aw_state == AwState.PRE_MOVEMENT
+        mdi_active = mdi_triggered or self._mdi_latch_set or self._aw_state is AwState.PRE_MOVEMENT
         
         gap_handled = False
-        if (ageC >= cfg.stop_gap_s or ageE >= cfg.stop_gap_s) and self._activity_score < cfg.activity_reset_a0:
+        if (l2_stale or ageE >= stop_gap_s) and act < a0_reset:
             # Hard gap: always reset
             self._reset_origin("STOP_GAP_TIMEOUT", False, True); gap_handled = True
-        elif ageC >= cfg.noise_gap_s and self._activity_score >= cfg.activity_reset_a0 and not mdi_active:
+        elif ageC >= cfg.noise_gap_s and act >= a0_reset and not mdi_active:
             # Soft gap: only reset if MDI is NOT active (v0.4.5 fix)
             self._reset_origin("NO_DISP_ACTIVE", True, False); gap_handled = True
-        elif self._origin_commit_set and cfg.movement_hold_s < ageC < cfg.stop_gap_s:
-            if self._aw_state == AwState.MOVEMENT:
+        elif self._origin_commit_set and cfg.movement_hold_s < ageC < stop_gap_s:
+            if self._aw_state is AwState.MOVEMENT:
                 self._aw_state, self._aw_reason = AwState.PRE_ROTATION, AwReason.HOLD_DECAY
             self._speed_deg_s *= 0.9
         
         # MDI state transitions (after gap check)
         if not gap_handled:
-            if mdi_trem > cfg.mdi_tremor_max and self._aw_state == AwState.PRE_MOVEMENT:
+            if mdi_trem > tremor_max and self._aw_state is AwState.PRE_MOVEMENT:
                 self._reset_origin("MDI_TREMOR", True, True); gap_handled = True
-            elif self._aw_state == AwState.PRE_MOVEMENT and not self._origin_candidate_set:
-                if ageE > cfg.mdi_hold_s and self._activity_score < cfg.activity_threshold_low:
+            elif self._aw_state is AwState.PRE_MOVEMENT and not self._origin_candidate_set:
+                if ageE > cfg.mdi_hold_s and act < cfg.activity_threshold_low:
                     self._reset_origin("MDI_HOLD_TIMEOUT", False, True); gap_handled = True
             if not gap_handled:
                 # Apply MDI state change
-                if mdi_triggered and self._aw_state in (AwState.STILL, AwState.NOISE):
+                if mdi_triggered and self._aw_state in _AW_QUIET:
                     self._aw_state, self._aw_reason = AwState.PRE_MOVEMENT, mdi_reason
-                elif mdi_reason in (AwReason.MDI_LATCH_DROPPED, AwReason.MDI_TRIGGER_A_DROPPED):
-                    if self._aw_state == AwState.PRE_MOVEMENT:
-                        self._aw_state = AwState.NOISE if self._activity_score >= cfg.activity_threshold_low else AwState.STILL
+                elif mdi_reason in _MDI_DROP_REASONS:
+                    if self._aw_state is AwState.PRE_MOVEMENT:
+                        self._aw_state = AwState.NOISE if act >= cfg.activity_threshold_low else AwState.STILL
                         self._aw_reason = mdi_reason
         
         if not gap_handled:
@@ -522,10 +740,10 @@ class L1PhysicalActivity:
                     self._origin_candidate_set, self._origin_candidate_time_s = True, now_s
                     self._origin_candidate_conf = min(1, 0.3 + 0.2*(pool_chg/5) + 0.2*(len(valid_pools)/3) + 0.3*pool_vr)
                     if self._origin_time0_s is None: self._origin_time0_s = self._micro_t0_s or now_s
-                    if self._aw_state in (AwState.STILL, AwState.NOISE, AwState.PRE_MOVEMENT):
+                    if self._aw_state in _AW_PRE_CANDIDATE:
                         self._aw_state, self._aw_reason = AwState.PRE_ROTATION, AwReason.CANDIDATE_POOL
                 elif self._origin_candidate_set and not strong:
-                    if pool_chg == 0 and self._activity_score < cfg.activity_threshold_low:
+                    if pool_chg == 0 and act < cfg.activity_threshold_low:
                         self._reset_origin("CANDIDATE_DROPPED", False, True); gap_handled = True
             
             if not gap_handled and not self._origin_commit_set:
@@ -550,7 +768,7 @@ class L1PhysicalActivity:
                 self._disp_from_origin_deg = wrap_deg_signed((self._theta_hat_rot - self._origin_theta_hat_rot)*360)
             if dt_s > 0:
                 delta_d = wrap_deg_signed(self._disp_from_origin_deg - self._prev_disp_from_origin_deg)
-                alpha = 1 - math.exp(-dt_s/cfg.speed_ema_tau_s)
+                alpha = 1 - _exp(-dt_s/cfg.speed_ema_tau_s)
                 self._speed_deg_s = (1-alpha)*self._speed_deg_s + alpha*abs(delta_d)/dt_s
             self._prev_disp_from_origin_deg = self._disp_from_origin_deg
             if abs(self._disp_from_origin_deg) >= 15: self._early_dir = "CW" if self._disp_from_origin_deg > 0 else "CCW"
@@ -562,56 +780,195 @@ class L1PhysicalActivity:
                 if abs(self._disp_from_origin_deg) > cfg.movement_confirm_deg: self._origin_conf = min(1, self._origin_conf + 0.1*dt_s)
                 elif self._speed_deg_s > cfg.speed_confirm_deg_s: self._origin_conf = min(1, self._origin_conf + 0.05*dt_s)
         
+        if record_to is not None:
+            record_to.push_row(now_s, self._state, self._theta_hat_rot, dtheta, act, self._encoder_conf)
+        if not snapshot:
+            self._last_snapshot = None  # also disables idle-tick coalescing against a stale snapshot
+            return None
         latch_age = (now_s - self._mdi_latch_t0_s) if self._mdi_latch_set and self._mdi_latch_t0_s else None
         mdi_conf_used = mdi_conf_acc if mdi_conf_acc > 0 else mdi_conf  # v0.4.5: conf_used
-        return L1Snapshot(state=self._state, reason=self._reason, theta_hat_rot=self._theta_hat_rot, theta_hat_deg=theta_deg,
-            delta_theta_deg_signed=dtheta, activity_score=self._activity_score, direction_effective=self._direction_effective,
-            direction_conf=self._direction_conf, lock_state=self._lock_state, encoder_conf=self._encoder_conf, dt_s=dt_s,
-            t_last_cycle_s=self._t_last_cycle_s, t_last_event_s=self._t_last_event_s, total_cycles=cycles_physical_total,
-            delta_cycles=delta_cycles, total_events=self._total_events, delta_events=events_this_batch, ageE_s=ageE, ageC_s=ageC,
-            l2_stale=l2_stale, to_pool_hist=dict(self._to_pool_hist), pool_changes_win=pool_chg, pool_unique_win=pool_uniq,
-            pool_valid_rate_win=pool_vr, mdi_mode=cfg.mdi_mode, mdi_ev_win=ev_win, mdi_micro_deg_per_step_used=step_size,
-            mdi_micro_acc=self._mdi_micro_acc, mdi_disp_micro_deg=mdi_deg, mdi_conf=mdi_conf, mdi_conf_acc=mdi_conf_acc,
-            mdi_conf_used=mdi_conf_used,  # v0.4.5: CRITICAL wiring
-            mdi_tremor_score=mdi_trem, mdi_pool_changes=mdi_chg, mdi_unique_pools=mdi_uniq, mdi_valid_rate=mdi_vr,
-            micro_t0_s=self._micro_t0_s, micro_dir_hint=self._micro_dir_hint, mdi_latch_set=self._mdi_latch_set,
-            mdi_latch_t0_s=self._mdi_latch_t0_s, mdi_latch_age_s=latch_age, mdi_changes_since_latch=self._mdi_changes_since_latch,
-            mdi_confirmed=self._mdi_confirmed, mdi_latch_reason=self._mdi_latch_reason,
-            origin_candidate_set=self._origin_candidate_set, origin_candidate_time_s=self._origin_candidate_time_s,
-            origin_commit_set=self._origin_commit_set, origin_time_s=self._origin_time_s, origin_time0_s=self._origin_time0_s,
-            origin_theta_deg=(self._origin_theta_hat_rot*360)%360 if self._origin_theta_hat_rot else None,
-            origin_conf=self._origin_conf, disp_acc_deg=self._disp_acc_deg, disp_from_origin_deg=self._disp_from_origin_deg,
-            speed_deg_s=self._speed_deg_s, early_dir=self._early_dir, aw_state=self._aw_state, aw_reason=self._aw_reason)
+        # Histogram copy is shared by snapshots until the next record_pool() (read-only for callers)
+        pool_hist = self._to_pool_hist_snap
+        if pool_hist is None: pool_hist = self._to_pool_hist_snap = dict(self._to_pool_hist)
+        # Positional, in L1Snapshot field order: ~6x cheaper than matching 56 keywords per tick
+        self._last_snapshot = L1Snapshot(
+            self._state, self._reason, self._theta_hat_rot, dtheta, act,  # state .. activity_score
+            self._direction_effective, self._direction_conf, self._lock_state, self._encoder_conf, dt_s,
+            self._t_last_cycle_s, self._t_last_event_s, cycles_physical_total, delta_cycles,  # timing, totals
+            self._total_events, events_this_batch, ageE, ageC, l2_stale,
+            pool_hist, pool_chg, pool_uniq, pool_vr,  # to_pool_hist .. pool_valid_rate_win
+            cfg.mdi_mode, ev_win, step_size, self._mdi_micro_acc, mdi_deg,  # mdi_mode .. mdi_disp_micro_deg
+            mdi_conf, mdi_conf_acc, mdi_conf_used,  # v0.4.5: mdi_conf_used CRITICAL wiring
+            mdi_trem, mdi_chg, mdi_uniq, mdi_vr,  # mdi_tremor_score .. mdi_valid_rate
+            self._micro_t0_s, self._micro_dir_hint,
+            self._mdi_latch_set, self._mdi_latch_t0_s, latch_age, self._mdi_changes_since_latch,
+            self._mdi_confirmed, self._mdi_latch_reason,
+            self._origin_candidate_set, self._origin_candidate_time_s,
+            self._origin_commit_set, self._origin_time_s, self._origin_time0_s,
+            (self._origin_theta_hat_rot*360)%360 if self._origin_theta_hat_rot else None,  # origin_theta_deg
+            self._origin_conf, self._disp_acc_deg, self._disp_from_origin_deg,
+            self._speed_deg_s, self._early_dir, self._aw_state, self._aw_reason)
+        return self._last_snapshot
+    
+    def update_inplace(self, wall_time: float, cycles_physical_total: float, events_this_batch: int = 0, **kw) -> None:
+        """update() for callers that only read state / aw_state: same state changes, no snapshot."""
+        self.update(wall_time, cycles_physical_total, events_this_batch, snapshot=False, **kw)
     
     def _compute_aw(self, mdi_trig, mdi_r):
         cfg = self.config
         if self._origin_commit_set:
             if abs(self._disp_from_origin_deg) >= cfg.movement_confirm_deg: return AwState.MOVEMENT, AwReason.MOVEMENT_DISP_CONFIRMED
             if self._speed_deg_s >= cfg.speed_confirm_deg_s: return AwState.MOVEMENT, AwReason.MOVEMENT_SPEED_CONFIRMED
-            if self._lock_state in cfg.lock_states_for_moving: return AwState.MOVEMENT, AwReason.MOVEMENT_LOCK_ACCELERATED
+            if self._lock_moving: return AwState.MOVEMENT, AwReason.MOVEMENT_LOCK_ACCELERATED
             return AwState.PRE_ROTATION, AwReason.PRE_ROT_ORIGIN_SET
         if self._origin_candidate_set: return AwState.PRE_ROTATION, AwReason.CANDIDATE_POOL
         if mdi_trig: return AwState.PRE_MOVEMENT, mdi_r
         if self._activity_score >= cfg.activity_threshold_low: return AwState.NOISE, AwReason.NOISE_ACC_BELOW_THRESHOLD
         return AwState.STILL, AwReason.STILL_LOW_ACTIVITY
     
-    def _compute_l1_state(self, act, disp, gap_C, gap_E):
+    def _compute_l1_state(self, act, disp, age_C, age_E):
         cfg = self.config
-        if gap_C >= cfg.gap_ms and gap_E >= cfg.gap_ms: return L1State.STILL, L1Reason.STILL_GAP_TIMEOUT
-        if act < cfg.activity_threshold_low and disp < cfg.displacement_threshold: return L1State.STILL, L1Reason.STILL_LOW_ACTIVITY
+        # Tiered lookup (see _L1_*_TABLE): only the tests of the reached tier are evaluated.
+        # Gap timeout compared in seconds (the ages from update(), gap_ms pre-divided)
+        if age_C >= cfg._gap_s and age_E >= cfg._gap_s: return _L1_GAP_RESULT
         if disp >= cfg.displacement_threshold:
-            if self._lock_state in cfg.lock_states_for_moving: return L1State.MOVING, L1Reason.MOVING_LOCKED
-            if self._direction_conf >= cfg.direction_conf_threshold: return L1State.MOVING, L1Reason.MOVING_STABLE_DIR
-            return L1State.DISPLACEMENT, L1Reason.DISP_ABOVE_D0
-        if act >= cfg.activity_threshold_high: return L1State.SCRAPE, L1Reason.SCRAPE_HIGH_ACTIVITY
-        if act >= cfg.activity_threshold_low: return L1State.FEELING, L1Reason.FEELING_ACTIVITY_NO_DISP
-        return L1State.STILL, L1Reason.STILL_LOW_ACTIVITY
+            return _L1_DISP_TABLE[(self._lock_moving << 1) | (self._direction_conf >= cfg.direction_conf_threshold)]
+        return _L1_ACT_TABLE[((act >= cfg.activity_threshold_high) << 1) | (act >= cfg.activity_threshold_low)]
+    
+    def _update_l1_state_hysteresis(self, disp, age_C, age_E):
+        """L1 state with hysteresis bands and consecutive-update confirmation (see L1Config)."""
+        cfg, act, state = self.config, self._activity_score, self._state
+        if state is L1State.STILL: act *= cfg._act_gain_still
+        elif state is L1State.SCRAPE: act *= cfg._act_gain_scrape
+        elif state is L1State.DISPLACEMENT or state is L1State.MOVING: disp *= cfg._disp_gain_moving
+        new_state, new_reason = self._compute_l1_state(act, disp, age_C, age_E)
+        if new_state is not state:
+            if new_state is self._pending_state: self._pending_count += 1
+            else: self._pending_state, self._pending_count = new_state, 1
+            up = _L1_STATE_RANK[new_state] > _L1_STATE_RANK[state]
+            if self._pending_count < (cfg.min_consecutive_up if up else cfg.min_consecutive_down): return
+        self._pending_state, self._pending_count = None, 0
+        self._state, self._reason = new_state, new_reason
     
     def _hard_reset(self):
         self._state, self._encoder_conf, self._activity_score, self._events_without_cycles = L1State.STILL, 0, 0, 0
+        self._pending_state, self._pending_count = None, 0
         self._reset_origin("HARD_RESET", False, True)
     
     def reset(self): self.__init__(self.config)
+    
+    @classmethod
+    def specialized(cls, config: L1Config) -> "L1PhysicalActivity":
+        """
+        New tracker whose per-tick L1 state decision has `config`'s thresholds folded in.
+
+        A factory: `config` is required (pass L1_CONFIG_DEFAULT for the defaults),
+        so L1PhysicalActivity(cfg).specialized() fails instead of dropping `cfg`.
+
+        With Numba available the activity/encoder recurrences also run compiled
+        (_l1_kernels.l1_activity_step; scores then always come back as floats).
+        Same results as L1PhysicalActivity(config) as long as the config is not
+        mutated afterwards (the generic instance re-reads it every tick).
+        """
+        inst = cls(config)
+        inst._compute_l1_state = MethodType(_specialize_l1_state(inst.config), inst)
+        step = _load_activity_step()
+        if step is not None: inst._activity_step = step
+        return inst
+    
+    def replay(self, wall_time, cycles_physical_total, events_this_batch=None, direction_conf=None, lock_state=None):
+        """
+        Offline replay: L1State per sample for whole arrays (requires NumPy; Numba if available).
+
+        Same L1 state as calling update() per sample on a freshly reset tracker with
+        this config. direction_conf / lock_state give the value in effect per sample
+        (None = the reset defaults). Does not touch this instance's state.
+        """
+        return self.replay_columns(wall_time, cycles_physical_total, events_this_batch,
+                                   direction_conf, lock_state)["state"]
+    
+    def replay_columns(self, wall_time, cycles_physical_total, events_this_batch=None, direction_conf=None,
+                       lock_state=None) -> Dict[str, Any]:
+        """
+        Offline replay as columns: dict of per-sample arrays, named as the L1Snapshot fields.
+
+        Keys: state (L1State objects), theta_hat_rot, theta_hat_deg, delta_theta_deg_signed,
+        delta_cycles, activity_score, encoder_conf. Inputs and semantics as replay(). Columns without
+        history are computed vectorized; the time/activity recurrences run in
+        _l1_kernels.l1_state_scan.
+        """
+        import numpy as np
+        try:
+            from ._l1_kernels import l1_state_scan
+        except ImportError:  # stand-alone fallback
+            from _l1_kernels import l1_state_scan  # type: ignore
+        cfg = self.config
+        wall_time = np.asarray(wall_time, dtype=np.float64)
+        total = np.asarray(cycles_physical_total, dtype=np.float64)
+        n = len(wall_time)
+        events = np.zeros(n, dtype=np.int64) if events_this_batch is None else np.asarray(events_this_batch, dtype=np.int64)
+        conf = np.zeros(n) if direction_conf is None else np.asarray(direction_conf, dtype=np.float64)
+        lock = np.full(n, "UNLOCKED", dtype=object) if lock_state is None else np.asarray(lock_state, dtype=object)
+        lock_moving = np.isin(lock, list(cfg.lock_states_for_moving))
+        # Stateless per-sample terms (a fresh tracker starts from total 0, theta 0)
+        delta_cycles = np.diff(total, prepend=0.0)
+        theta = total / cfg.cycles_per_rot
+        dtheta = np.mod(np.diff(theta, prepend=0.0) * 360 + 180.0, 360.0) - 180.0
+        codes, activity, encoder = l1_state_scan(
+            wall_time, delta_cycles > 0, np.abs(dtheta / 360), events, conf, lock_moving,
+            float(cfg.hard_reset_s), float(cfg.activity_decay_rate), float(cfg.encoder_tau_s), float(cfg._gap_s),
+            float(cfg.activity_threshold_low), float(cfg.activity_threshold_high),
+            float(cfg.displacement_threshold), float(cfg.direction_conf_threshold),
+            float(cfg._act_gain_still), float(cfg._act_gain_scrape), float(cfg._disp_gain_moving),
+            int(cfg.min_consecutive_up), int(cfg.min_consecutive_down))
+        return {"state": np.take(np.array(list(L1State), dtype=object), codes), "theta_hat_rot": theta,
+                "theta_hat_deg": np.mod(theta * 360, 360), "delta_theta_deg_signed": dtheta,
+                "delta_cycles": delta_cycles, "activity_score": activity, "encoder_conf": encoder}
+
+class L1HistoryRing:
+    """
+    Rolling history of the last `capacity` L1 snapshots as parallel NumPy columns (requires NumPy).
+
+    push() stores a few scalars per tick into preallocated arrays instead of keeping
+    snapshot objects; columns() returns them oldest-first, keyed like replay_columns().
+    update(..., record_to=ring) writes the same row straight from the tracker, so
+    with snapshot=False no L1Snapshot is allocated at all.
+    """
+    __slots__ = ("_np", "_cap", "_idx", "_n", "wall_time", "state", "theta_hat_rot",
+                 "delta_theta_deg_signed", "activity_score", "encoder_conf")
+    _FLOAT_COLUMNS = ("wall_time", "theta_hat_rot", "delta_theta_deg_signed", "activity_score", "encoder_conf")
+    
+    def __init__(self, capacity: int = 1024):
+        import numpy as np
+        self._np, self._cap, self._idx, self._n = np, capacity, 0, 0
+        self.state = np.zeros(capacity, dtype=np.int8)  # L1State declaration order
+        for name in self._FLOAT_COLUMNS: setattr(self, name, np.zeros(capacity, dtype=np.float64))
+    
+    def __len__(self) -> int: return self._n
+    
+    def push(self, snap: L1Snapshot, wall_time: float) -> None:
+        self.push_row(wall_time, snap.state, snap.theta_hat_rot, snap.delta_theta_deg_signed,
+                      snap.activity_score, snap.encoder_conf)
+    
+    def push_row(self, wall_time: float, state: L1State, theta_hat_rot: float, delta_theta_deg_signed: float,
+                 activity_score: float, encoder_conf: float) -> None:
+        i = self._idx
+        self.wall_time[i] = wall_time
+        self.state[i] = _L1_STATE_RANK[state]
+        self.theta_hat_rot[i] = theta_hat_rot
+        self.delta_theta_deg_signed[i] = delta_theta_deg_signed
+        self.activity_score[i] = activity_score
+        self.encoder_conf[i] = encoder_conf
+        self._idx = i + 1 if i + 1 < self._cap else 0
+        if self._n < self._cap: self._n += 1
+    
+    def columns(self) -> Dict[str, Any]:
+        """Oldest-first copies of the stored columns; state as L1State objects."""
+        np = self._np
+        order = np.arange(self._idx - self._n, self._idx) % self._cap
+        cols = {name: getattr(self, name)[order] for name in self._FLOAT_COLUMNS}
+        cols["state"] = np.take(np.array(list(L1State), dtype=object), self.state[order])
+        return cols
 
 # Presets
 L1_CONFIG_DEFAULT = L1Config()
@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+conftest.py — Shared pytest setup for the Action Gate v0.2 tests.
+
+Puts the repository root on sys.path so `sym_cycles` imports resolve
+without installation. Run with: pytest -x --ff tests/
+
+Gate log lines are still collected in GateOutput.log_entries, but the
+`sym_cycles` logger is held at WARNING behind a NullHandler so evaluate()
+doesn't format and emit an INFO record per call. Test-side step output
+goes through the test module loggers; show it with --log-level=DEBUG.
+
+Gates driven to OBSERVE / ARMED / ACTIVE are primed once per session and
+handed out as deep copies, so tests don't replay the priming inputs.
+
+Contract: SORA CodeX Contract v1.0 / D-C Contract v0.2
+"""
+
+import copy
+import logging
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pytest
+
+from sym_cycles.action_gate_v0_2 import ActionGateV0_2, GateInput, ActionIntent
+
+_gate_logger = logging.getLogger("sym_cycles")
+_gate_logger.addHandler(logging.NullHandler())
+_gate_logger.setLevel(logging.WARNING)
+
+
+# Inputs that drive a fresh gate to each target state.
+# Last timestamp per state: OBSERVE=100, ARMED=200, ACTIVE=300.
+_BASE = GateInput(now_ms=0, coherence_score=0.8, lock_state="LOCKED", data_age_ms=100, intent_source="test")
+_TO_OBSERVE = _BASE._replace(now_ms=100, coherence_score=0.3, lock_state="UNLOCKED", data_age_ms=0)
+_TO_ARMED = _BASE._replace(now_ms=200, coherence_score=0.5, data_age_ms=50, arm_signal=True)
+_TO_ACTIVE = _BASE._replace(now_ms=300, action_intent=ActionIntent.INTENT_ACTIVATE)
+
+PRIME_SCRIPTS = {
+    "IDLE": [],
+    "OBSERVE": [_TO_OBSERVE],
+    "ARMED": [_TO_OBSERVE, _TO_ARMED],
+    "ACTIVE": [_TO_OBSERVE, _TO_ARMED, _TO_ACTIVE],
+}
+
+
+def build_primed_bank():
+    """Drive one pristine gate per PRIME_SCRIPTS entry."""
+    bank = {}
+    for name, script in PRIME_SCRIPTS.items():
+        gate = ActionGateV0_2()
+        for inp in script:
+            gate.evaluate(inp)
+        bank[name] = gate
+    return bank
+
+
+class GateHarness:
+    """A primed gate plus the timestamp of the last input it saw."""
+
+    STEP_MS = 100
+
+    def __init__(self, gate, t):
+        self.gate = gate
+        self.t = t
+
+    def apply(self, inp):
+        """Evaluate `inp` one step after the previous input."""
+        self.t += self.STEP_MS
+        return self.gate.evaluate(inp._replace(now_ms=self.t))
+
+
+@pytest.fixture(scope="session")
+def _primed():
+    return build_primed_bank()
+
+
+@pytest.fixture
+def armed_gate(_primed):
+    return copy.deepcopy(_primed["ARMED"])
+
+
+@pytest.fixture
+def active_gate(_primed):
+    return copy.deepcopy(_primed["ACTIVE"])
+
+
+@pytest.fixture
+def harness(_primed):
+    """Factory: harness(state) -> GateHarness over a fresh copy of that primed gate."""
+    def make(state):
+        script = PRIME_SCRIPTS[state]
+        return GateHarness(copy.deepcopy(_primed[state]), script[-1].now_ms if script else 0)
+    return make
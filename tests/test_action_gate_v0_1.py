@@ -0,0 +1,171 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+test_action_gate_v0_1.py — Action Gate v0.1 API Tests
+
+Covers the v0.1 entry points that v0.2 does not share (the regression
+comparison against v0.2 lives in test_action_gate_v0_2_verify.py).
+
+Contract: SORA CodeX Contract v1.0
+"""
+
+import pytest
+
+from sym_cycles.action_gate_v0_1 import (
+    ActionGateV0_1,
+    GateConfig,
+    GateInput,
+    GateState,
+    LockState,
+)
+
+
+def _armed_after_two_ticks(lock_state):
+    """Whether a fresh gate reaches ARMED on LOCKED-level inputs with `lock_state`."""
+    gate = ActionGateV0_1()
+    gate.evaluate(GateInput(now_ms=100, coherence_score=0.55, lock_state=lock_state))
+    out = gate.evaluate(GateInput(now_ms=200, coherence_score=0.55, lock_state=lock_state))
+    return out.state is GateState.ARMED
+
+
+# =============================================================================
+# LOCK STATE ENTRY
+# =============================================================================
+
+@pytest.mark.parametrize("lock", [LockState.LOCKED, 2, "LOCKED"])
+def test_lock_state_enum_int_or_name(lock):
+    """lock_state given as LockState, int value or name behaves the same"""
+    assert _armed_after_two_ticks(lock)
+
+
+def test_lock_state_assigned_after_construction():
+    """GateInput stays mutable: a name assigned later is honoured and kept as given"""
+    gate = ActionGateV0_1()
+    inp = GateInput(now_ms=100, coherence_score=0.55)
+    gate.evaluate(inp)
+
+    inp.now_ms = 200
+    inp.lock_state = "LOCKED"
+    out = gate.evaluate(inp)
+
+    assert out.state is GateState.ARMED
+    assert inp.lock_state == "LOCKED"
+
+
+def test_lock_state_rejects_bool():
+    """bool is not a lock state (True would otherwise read as SOFT_LOCK)"""
+    gate = ActionGateV0_1()
+    with pytest.raises(TypeError):
+        gate.evaluate(GateInput(now_ms=100, lock_state=True))
+
+
+# =============================================================================
+# RECONFIGURE
+# =============================================================================
+
+# Every threshold moved off its default, and inputs that land between old and new values
+_CONFIG = GateConfig(coherence_threshold=0.45, stale_data_threshold_ms=1000,
+                     arm_coherence_min=0.25, activation_coherence_min=0.5)
+_RECONFIG_STEPS = [
+    dict(coherence_score=0.3, lock_state="SOFT_LOCK", arm_signal=True),              # arms only under _CONFIG
+    dict(coherence_score=0.55, lock_state="LOCKED", activate_signal=True),           # activates only under _CONFIG
+    dict(coherence_score=0.5, lock_state="LOCKED"),                                  # stays ACTIVE only under _CONFIG
+    dict(coherence_score=0.8, lock_state="LOCKED", data_age_ms=2000),                # stale only under _CONFIG
+    dict(coherence_score=0.5, lock_state="LOCKED"),                                  # leaves FALLBACK only under _CONFIG
+    dict(coherence_score=0.3, lock_state="LOCKED", arm_signal=True),
+]
+
+
+def _run(gate, t0):
+    """(state, decision, reason, allowed, log_entries) per _RECONFIG_STEPS row."""
+    outs = []
+    for t, step in enumerate(_RECONFIG_STEPS, start=1):
+        out = gate.evaluate(GateInput(now_ms=t0 + 100 * t, **step))
+        outs.append((out.state, out.decision, out.reason, out.allowed, list(out.log_entries)))
+    return outs
+
+
+def test_reconfigure_matches_constructed_gate():
+    """A live gate after reconfigure(cfg) behaves like ActionGateV0_1(cfg)"""
+    constructed, reconfigured, default = ActionGateV0_1(_CONFIG), ActionGateV0_1(), ActionGateV0_1()
+    for gate in (constructed, reconfigured, default):
+        gate.evaluate(GateInput(now_ms=100, coherence_score=0.3))  # IDLE -> OBSERVE under any config
+    reconfigured.reconfigure(_CONFIG)
+
+    expected = _run(constructed, 100)
+    assert _run(reconfigured, 100) == expected
+    assert _run(default, 100) != expected
+    assert reconfigured.get_debug_state() == constructed.get_debug_state()
+
+
+# =============================================================================
+# OUTPUT REUSE
+# =============================================================================
+
+def test_reuse_output_patches_previous_object():
+    """reuse_output=True: a repeated state/decision/reason returns the same object, patched"""
+    gate = ActionGateV0_1()
+    gate.evaluate(GateInput(now_ms=100, coherence_score=0.3), reuse_output=True)
+    b = gate.evaluate(GateInput(now_ms=200, coherence_score=0.3), reuse_output=True)
+    c = gate.evaluate(GateInput(now_ms=300, coherence_score=0.3), reuse_output=True)
+
+    assert b is c
+    assert b.timestamp_ms == 300  # the earlier result changed under the caller
+
+    d = gate.evaluate(GateInput(now_ms=400, coherence_score=0.3))
+    assert d is not c and c.timestamp_ms == 300  # without the flag: fresh output, cache untouched
+
+
+@pytest.mark.parametrize("via", ["force_fallback", "reset"])
+def test_reuse_output_ends_at_force_fallback_and_reset(via):
+    """Outputs reused before force_fallback() / reset() are never patched afterwards"""
+    gate = ActionGateV0_1()
+    fallback = GateInput(now_ms=100, force_fallback=True)
+    before = gate.evaluate(fallback, reuse_output=True)  # FALLBACK / manual_fallback
+
+    if via == "force_fallback":
+        forced = gate.force_fallback(200)
+        assert forced is not before
+    else:
+        gate.reset(200)
+    after = gate.evaluate(GateInput(now_ms=300, force_fallback=True), reuse_output=True)
+
+    assert (after.state, after.reason) == (before.state, before.reason)
+    assert after is not before
+    assert before.timestamp_ms == 100
+    assert gate.evaluate(GateInput(now_ms=400, force_fallback=True), reuse_output=True) is after
+
+
+# =============================================================================
+# LOGGING
+# =============================================================================
+
+@pytest.mark.parametrize("via", ["evaluate", "force_fallback"])
+def test_logging_one_record_per_tick(via, caplog):
+    """Each tick's entries reach the logger as one record, during that call"""
+    gate = ActionGateV0_1()
+    with caplog.at_level("INFO", logger="sym_cycles.action_gate_v0_1"):
+        gate.enable_logging()  # reads the INFO level set above
+        first = gate.evaluate(GateInput(now_ms=100, coherence_score=0.5))
+        assert [r.getMessage() for r in caplog.records] == ["\n".join(first.log_entries)]
+
+        if via == "evaluate":
+            out = gate.evaluate(GateInput(now_ms=200, force_fallback=True))
+            new_entries = out.log_entries
+        else:
+            out = gate.force_fallback(200)
+            new_entries = out.log_entries[len(first.log_entries):]  # carries the last tick's entries
+        assert len(caplog.records) == 2
+        assert caplog.records[-1].getMessage() == "\n".join(new_entries)
+        assert "GATE_FALLBACK reason=manual_fallback t_ms=200" in caplog.records[-1].getMessage()
+
+
+def test_log_text_joins_entries():
+    """GateOutput.log_text is the newline-joined log_entries; empty when not collected"""
+    out = ActionGateV0_1().evaluate(GateInput(now_ms=100, coherence_score=0.3))
+    assert out.log_text == "\n".join(out.log_entries)
+    assert "GATE_ENTER state=OBSERVE" in out.log_text
+
+    quiet = ActionGateV0_1(collect_log_entries=False).evaluate(GateInput(now_ms=100, coherence_score=0.3))
+    assert quiet.log_entries == ()
+    assert quiet.log_text == ""
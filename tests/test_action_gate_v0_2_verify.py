@@ -0,0 +1,353 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+test_action_gate_v0_2_verify.py — Verification & Regression Tests
+
+Task Brief 04: Verify Action Gate v0.2 against v0.1 behavior.
+
+Tests:
+    A. Regression: v0.2 with INTENT_NONE == v0.1 behavior
+    B. Intent stability: repeated scenarios, revocability
+    C. Logging consistency: complete, no semantic terms
+
+Contract: SORA CodeX Contract v1.0 / D-C Contract v0.2
+"""
+
+import itertools
+import re
+
+import pytest
+
+from sym_cycles.action_gate_v0_1 import (
+    ActionGateV0_1,
+    GateInput as GateInputV1,
+)
+from sym_cycles.action_gate_v0_2 import (
+    ActionGateV0_2,
+    GateInput as GateInputV2,
+    GateState,
+    GateDecision,
+    ActionIntent,
+)
+
+ACT, HOLD, REL, NONE = (ActionIntent.INTENT_ACTIVATE, ActionIntent.INTENT_HOLD,
+                        ActionIntent.INTENT_RELEASE, ActionIntent.INTENT_NONE)
+
+
+# Fixed-shape v0.2 inputs: IDLE -> OBSERVE, OBSERVE -> ARMED, ARMED -> ACTIVE
+BASE_INPUT = GateInputV2(now_ms=0, coherence_score=0.8, lock_state="LOCKED", data_age_ms=100,
+                         action_intent=NONE, intent_source="test")
+_OBSERVE = BASE_INPUT._replace(coherence_score=0.3, lock_state="UNLOCKED", data_age_ms=0)
+_ARM = BASE_INPUT._replace(coherence_score=0.5, data_age_ms=50, arm_signal=True)
+
+
+def _observe_input(t):
+    return _OBSERVE._replace(now_ms=t)
+
+
+def _armed_primer(t):
+    return _ARM._replace(now_ms=t)
+
+
+def _activate_input(t):
+    return BASE_INPUT._replace(now_ms=t, action_intent=ACT)
+
+
+# Semantic terms that must never appear in gate logs (substring match, any case)
+_FORBIDDEN_RE = re.compile(r"truth|belief|desire|want|feel|think|meaning|semantic", re.IGNORECASE)
+
+# Event types every accepted-activation tick must log
+_REQUIRED_EVENTS = frozenset({"ACTION_INTENT", "GATE_BASIS", "GATE_ENTER", "GATE_DECISION"})
+
+
+# (state, decision, allowed) by member name, comparable across v0.1 and v0.2 enums
+def _snapshot(gate, out):
+    return (gate.state.name, out.decision.name, out.allowed)
+
+
+# Regression steps, built once as matching v0.1 / v0.2 (INTENT_NONE) inputs
+def _paired_inputs(steps):
+    return ([GateInputV1(**s) for s in steps],
+            [GateInputV2(**s, action_intent=NONE) for s in steps])
+
+
+REG_STEPS = [
+    {"now_ms": 100, "coherence_score": 0.3, "lock_state": "UNLOCKED", "data_age_ms": 0},                     # -> OBSERVE
+    {"now_ms": 200, "coherence_score": 0.5, "lock_state": "LOCKED", "data_age_ms": 50, "arm_signal": True},  # -> ARMED
+]
+REG_V1, REG_V2 = _paired_inputs(REG_STEPS)
+
+FALLBACK_STEPS = [
+    {"now_ms": 100, "coherence_score": 0.8, "lock_state": "LOCKED", "data_age_ms": 0, "force_fallback": True},
+    {"now_ms": 100, "coherence_score": 0.8, "lock_state": "LOCKED", "data_age_ms": 6000},  # stale data
+]
+FALLBACK_V1, FALLBACK_V2 = _paired_inputs(FALLBACK_STEPS)
+
+# (coherence, lock, data_age) at 100 ms cadence; arm whenever not UNLOCKED
+_MIXED = [
+    (0.3, "UNLOCKED", 0),
+    (0.5, "SOFT_LOCK", 50),
+    (0.6, "LOCKED", 100),
+    (0.8, "LOCKED", 150),
+    (0.4, "UNLOCKED", 200),
+    (0.7, "LOCKED", 250),
+]
+MIXED_V1, MIXED_V2 = _paired_inputs([
+    {"now_ms": t, "coherence_score": coh, "lock_state": lock, "data_age_ms": age,
+     "arm_signal": lock != "UNLOCKED"}
+    for t, (coh, lock, age) in zip(itertools.count(100, 100), _MIXED)
+])
+
+
+# =============================================================================
+# A. REGRESSION TESTS
+# =============================================================================
+
+def test_regression_idle_to_observe():
+    """v0.2 INTENT_NONE: IDLE -> OBSERVE identical to v0.1"""
+    gate_v1 = ActionGateV0_1()
+    gate_v2 = ActionGateV0_2()
+
+    out_v1 = gate_v1.evaluate(REG_V1[0])
+    out_v2 = gate_v2.evaluate(REG_V2[0])
+
+    assert _snapshot(gate_v1, out_v1) == _snapshot(gate_v2, out_v2)
+
+
+def test_regression_observe_to_armed():
+    """v0.2 INTENT_NONE: OBSERVE -> ARMED identical to v0.1"""
+    gate_v1 = ActionGateV0_1()
+    gate_v2 = ActionGateV0_2()
+
+    # Move to OBSERVE
+    gate_v1.evaluate(REG_V1[0])
+    gate_v2.evaluate(REG_V2[0])
+
+    # Arm conditions
+    out_v1 = gate_v1.evaluate(REG_V1[1])
+    out_v2 = gate_v2.evaluate(REG_V2[1])
+
+    assert _snapshot(gate_v1, out_v1) == _snapshot(gate_v2, out_v2)
+
+
+def test_regression_armed_no_active_without_intent():
+    """v0.2 INTENT_NONE: ARMED does NOT go to ACTIVE (v0.1 with activate_signal would)"""
+    # This is expected DIFFERENCE: v0.2 requires intent
+    gate_v2 = ActionGateV0_2()
+    clock = itertools.count(100, 100)
+
+    # Move to ARMED
+    gate_v2.evaluate(_observe_input(next(clock)))
+    gate_v2.evaluate(_armed_primer(next(clock)))
+
+    # Perfect conditions but INTENT_NONE
+    inp = BASE_INPUT._replace(now_ms=next(clock), coherence_score=0.9)
+    out = gate_v2.evaluate(inp)
+
+    # v0.2 should stay ARMED (not go to ACTIVE without intent)
+    assert _snapshot(gate_v2, out) == ("ARMED", "HOLD_OBSERVE", False)
+
+
+def test_regression_fallback_patterns():
+    """v0.2 INTENT_NONE: Fallback patterns identical to v0.1"""
+    # force_fallback, then stale data — each on a fresh gate pair
+    for inp_v1, inp_v2 in zip(FALLBACK_V1, FALLBACK_V2):
+        gate_v1 = ActionGateV0_1()
+        gate_v2 = ActionGateV0_2()
+
+        out_v1 = gate_v1.evaluate(inp_v1)
+        out_v2 = gate_v2.evaluate(inp_v2)
+
+        assert _snapshot(gate_v1, out_v1) == _snapshot(gate_v2, out_v2) == ("FALLBACK", "FORCE_FALLBACK", False)
+
+
+def test_regression_no_extra_active_transitions():
+    """v0.2 INTENT_NONE: No extra ACTIVE transitions compared to v0.1 baseline"""
+    # Run identical sequence through both
+    gate_v1 = ActionGateV0_1()
+    gate_v2 = ActionGateV0_2()
+
+    v1_active_count = 0
+    v2_active_count = 0
+
+    for inp_v1, inp_v2 in zip(MIXED_V1, MIXED_V2):
+        out_v1 = gate_v1.evaluate(inp_v1)
+        out_v2 = gate_v2.evaluate(inp_v2)
+
+        if out_v1.decision.value == "ALLOW_ACTIVE":
+            v1_active_count += 1
+        if out_v2.decision.value == "ALLOW_ACTIVE":
+            v2_active_count += 1
+
+    # v0.2 should have NO active transitions without intent
+    # v0.1 may have some if activate_signal was implicit
+    assert v2_active_count == 0
+
+
+# =============================================================================
+# B. INTENT STABILITY TESTS
+# =============================================================================
+
+def test_intent_repeated_activate(armed_gate):
+    """INTENT_ACTIVATE from ARMED transitions to ACTIVE"""
+    gate = armed_gate
+    clock = itertools.count(300, 100)
+    assert gate.state.value == "ARMED"
+
+    # First ACTIVATE from ARMED -> should go to ACTIVE
+    out1 = gate.evaluate(_activate_input(next(clock)))
+    assert out1.decision.value == "ALLOW_ACTIVE"
+    assert gate.state.value == "ACTIVE"
+
+    # Per contract: INTENT_ACTIVATE only allowed from ARMED
+    # From ACTIVE, must use INTENT_HOLD to maintain
+    # Test that ACTIVATE from ACTIVE causes transition to OBSERVE (correct behavior)
+    out2 = gate.evaluate(BASE_INPUT._replace(now_ms=next(clock), data_age_ms=150, action_intent=ACT))
+    assert out2.decision.value == "HOLD_OBSERVE"
+
+
+def test_intent_repeated_hold(active_gate):
+    """Repeated INTENT_HOLD maintains ACTIVE"""
+    gate = active_gate
+    clock = itertools.count(400, 100)
+
+    # Repeated HOLD
+    hold_active_count = 0
+    for i in range(5):
+        t = next(clock)
+        inp = BASE_INPUT._replace(now_ms=t, coherence_score=0.75, data_age_ms=150 + i*50,
+                                  action_intent=HOLD)
+        out = gate.evaluate(inp)
+        if out.decision.value == "ALLOW_ACTIVE":
+            hold_active_count += 1
+
+    assert hold_active_count == 5
+
+
+def test_intent_revocability(armed_gate):
+    """ACTIVATE -> NONE revokes active state"""
+    gate = armed_gate
+    clock = itertools.count(300, 100)
+
+    out1 = gate.evaluate(_activate_input(next(clock)))
+
+    assert out1.decision.value == "ALLOW_ACTIVE"
+
+    # Revoke with NONE
+    out2 = gate.evaluate(BASE_INPUT._replace(now_ms=next(clock), data_age_ms=150))
+
+    assert out2.decision.value != "ALLOW_ACTIVE"
+    assert gate.state.value == "OBSERVE"
+
+
+_RELEASE = BASE_INPUT._replace(action_intent=REL)
+
+
+@pytest.mark.parametrize("start", ["OBSERVE", "ARMED", "ACTIVE"])
+def test_intent_release_dominant(start, harness):
+    """RELEASE is always dominant"""
+    h = harness(start)
+    h.apply(_RELEASE)
+    assert h.gate.state.value == "FALLBACK"
+
+
+def test_intent_alternating(armed_gate):
+    """Alternating ACTIVATE/HOLD/NONE"""
+    gate = armed_gate
+    clock = itertools.count(300, 100)
+
+    # ARMED -> ACTIVE, stay ACTIVE, ACTIVE -> OBSERVE
+    intents = (ACT, HOLD, NONE)
+    expected = ["ALLOW_ACTIVE", "ALLOW_ACTIVE", "HOLD_OBSERVE"]
+
+    # After OBSERVE, need to re-arm
+    decisions = []
+    for intent in intents:
+        t = next(clock)
+        inp = _ARM._replace(now_ms=t, coherence_score=0.8, data_age_ms=100, action_intent=intent)
+        decisions.append(gate.evaluate(inp).decision.value)
+
+    assert decisions == expected
+
+
+# =============================================================================
+# C. LOGGING CONSISTENCY TESTS
+# =============================================================================
+
+def test_logging_action_intent_present():
+    """ACTION_INTENT log event present"""
+    gate = ActionGateV0_2()
+    clock = itertools.count(100, 100)
+    inp = BASE_INPUT._replace(now_ms=next(clock), coherence_score=0.5, data_age_ms=0,
+                              action_intent=ACT, intent_source="test_source")
+    out = gate.evaluate(inp)
+
+    assert "ACTION_INTENT" in out.log_events
+    assert any("value=INTENT_ACTIVATE" in entry for entry in out.log_entries)
+    assert any("source=test_source" in entry for entry in out.log_entries)
+
+
+def test_logging_gate_decision_has_intent(armed_gate):
+    """GATE_DECISION includes intent field"""
+    out = armed_gate.evaluate(_activate_input(300))
+
+    assert "GATE_DECISION" in out.log_events
+    decision_entries = [e for e in out.log_entries if e.startswith("GATE_DECISION")]
+    assert any("intent=" in e for e in decision_entries)
+    assert any("basis=" in e for e in decision_entries)
+
+
+def test_logging_no_semantic_terms(armed_gate):
+    """Logs contain no semantic terms"""
+    out = armed_gate.evaluate(_activate_input(300))
+
+    assert _FORBIDDEN_RE.findall("\n".join(out.log_entries)) == []
+
+
+def test_logging_complete_fields(armed_gate):
+    """All required log fields present"""
+    out = armed_gate.evaluate(_activate_input(300))
+
+    # Check required events
+    assert _REQUIRED_EVENTS <= out.log_events, sorted(_REQUIRED_EVENTS - out.log_events)
+
+
+# =============================================================================
+# D. BATCH API
+# =============================================================================
+
+def test_evaluate_many_matches_evaluate():
+    """evaluate_many: same states/decisions as row-by-row evaluate"""
+    pytest.importorskip("numpy")
+    intents = (NONE, NONE, ACT, HOLD, NONE, REL)
+    rows = [inp._replace(action_intent=intent) for inp, intent in zip(MIXED_V2, intents)]
+
+    gate = ActionGateV0_2()
+    expected = []
+    for inp in rows:
+        out = gate.evaluate(inp)
+        expected.append((list(GateState).index(out.state), list(GateDecision).index(out.decision)))
+
+    batch_gate = ActionGateV0_2()
+    states, decisions = batch_gate.evaluate_many(
+        now_ms=[inp.now_ms for inp in rows],
+        coherence_score=[inp.coherence_score for inp in rows],
+        lock_state=[inp.lock_state for inp in rows],
+        data_age_ms=[inp.data_age_ms for inp in rows],
+        action_intent=[list(ActionIntent).index(inp.action_intent) for inp in rows],
+        arm_signal=[inp.arm_signal for inp in rows],
+    )
+
+    assert list(zip(states.tolist(), decisions.tolist())) == expected
+    assert batch_gate.get_debug_state() == gate.get_debug_state()
+
+
+@pytest.mark.parametrize("code", [-1, len(ActionIntent)])
+def test_evaluate_many_rejects_unknown_intent_code(code):
+    """evaluate_many: an intent code outside ActionIntent is an error, not a wrapped index"""
+    pytest.importorskip("numpy")
+    gate = ActionGateV0_2()
+    with pytest.raises(ValueError):
+        gate.evaluate_many(now_ms=[100, 200], coherence_score=[0.8, 0.8], lock_state=["LOCKED", "LOCKED"],
+                           data_age_ms=[0, 0], action_intent=[0, code])
+    assert gate.state == GateState.IDLE
@@ -0,0 +1,206 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+test_l1_physical_activity_replay.py — L1 offline replay / specialization parity
+
+Verifies L1PhysicalActivity.replay() / replay_columns() (array kernel) and the config-specialized
+tracker (L1PhysicalActivity.specialized()) against per-sample update() on the
+same input stream, update_inplace(), update()'s idle-tick coalescing (min_update_interval_s),
+L1Config hysteresis validation, the positional L1Snapshot construction, the
+incremental pool/MDI window stats and the L1HistoryRing columns (push / record_to).
+
+Usage:
+    pytest -x --ff tests/
+"""
+
+import random
+
+import pytest
+
+from sym_cycles.l1_physical_activity import (
+    AwReason,
+    AwState,
+    L1Config,
+    L1PhysicalActivity,
+    L1_CONFIG_DEFAULT,
+    L1_CONFIG_BENCH_TOLERANT,
+)
+
+# Sample spacing (s) covers steady ticks, gap timeouts and hard resets
+_DT_CHOICES = (0.0, 0.01, 0.05, 0.1, 0.3, 0.6, 2.0)
+_LOCKS = ("UNLOCKED", "SOFT_LOCK", "LOCKED")
+_CONFIG_HYSTERESIS = L1Config(activity_hysteresis=0.3, displacement_hysteresis=0.3,
+                              min_consecutive_up=2, min_consecutive_down=3)
+
+
+def _stream(seed, n=200):
+    rng = random.Random(seed)
+    t, total = 1.0, 0.0
+    rows = []
+    for _ in range(n):
+        t += rng.choice(_DT_CHOICES)
+        total += rng.choice((0, 0, 0, 1, 2, -1, 0.5))
+        rows.append((t, total, rng.choice((0, 0, 1, 2, 5, 8)), rng.random(), rng.choice(_LOCKS)))
+    return rows
+
+
+@pytest.mark.parametrize("config", [L1_CONFIG_DEFAULT, L1_CONFIG_BENCH_TOLERANT, _CONFIG_HYSTERESIS],
+                         ids=["default", "bench_tolerant", "hysteresis"])
+@pytest.mark.parametrize("seed", range(5))
+def test_replay_matches_update(config, seed):
+    pytest.importorskip("numpy")
+    rows = _stream(seed)
+    live = L1PhysicalActivity(config)
+    expected = [live.update(t, total, ev, direction_conf=conf, lock_state=lock).state
+                for t, total, ev, conf, lock in rows]
+
+    wall_time, totals, events, confs, locks = zip(*rows)
+    replayed = L1PhysicalActivity(config).replay(wall_time, totals, events, confs, locks)
+
+    assert list(replayed) == expected
+
+
+@pytest.mark.parametrize("config", [L1_CONFIG_DEFAULT, L1_CONFIG_BENCH_TOLERANT, _CONFIG_HYSTERESIS],
+                         ids=["default", "bench_tolerant", "hysteresis"])
+@pytest.mark.parametrize("seed", range(5))
+def test_specialized_matches_update(config, seed):
+    generic, special = L1PhysicalActivity(config), L1PhysicalActivity.specialized(config)
+    for t, total, ev, conf, lock in _stream(seed):
+        a = generic.update(t, total, ev, direction_conf=conf, lock_state=lock)
+        b = special.update(t, total, ev, direction_conf=conf, lock_state=lock)
+        assert (a.state, a.reason) == (b.state, b.reason)
+        assert (b.activity_score, b.encoder_conf) == pytest.approx((a.activity_score, a.encoder_conf), abs=1e-9)
+
+
+def test_specialized_requires_config():
+    with pytest.raises(TypeError):
+        L1PhysicalActivity(_CONFIG_HYSTERESIS).specialized()
+
+
+_COLUMNS = ("theta_hat_rot", "theta_hat_deg", "delta_theta_deg_signed", "delta_cycles", "activity_score", "encoder_conf")
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_replay_columns_match_snapshots(seed):
+    pytest.importorskip("numpy")
+    rows = _stream(seed)
+    live = L1PhysicalActivity()
+    snaps = [live.update(t, total, ev, direction_conf=conf, lock_state=lock) for t, total, ev, conf, lock in rows]
+
+    cols = L1PhysicalActivity().replay_columns(*zip(*rows))
+
+    assert list(cols["state"]) == [s.state for s in snaps]
+    for name in _COLUMNS:
+        assert list(cols[name]) == pytest.approx([getattr(s, name) for s in snaps], abs=1e-9), name
+
+
+def test_idle_ticks_coalesce():
+    l1 = L1PhysicalActivity(L1Config(min_update_interval_s=0.02))
+    first = l1.update(1.0, 1.0, 2, direction_conf=0.5, lock_state="LOCKED")
+    assert l1.update(1.01, 1.0, 0, direction_conf=0.5, lock_state="LOCKED") is first
+    assert l1.update(1.01, 1.0, 0, snapshot=False) is None   # coalesced, still no snapshot
+    assert l1.snapshot is first
+    assert l1.update(1.01, 1.0, 1) is not first           # new events
+    assert l1.update(1.05, 1.0, 0).dt_s == pytest.approx(0.04)  # past the interval
+
+
+@pytest.mark.parametrize("seed", range(3))
+def test_update_inplace_matches_update(seed):
+    full, inplace = L1PhysicalActivity(), L1PhysicalActivity()
+    for t, total, ev, conf, lock in _stream(seed):
+        snap = full.update(t, total, ev, direction_conf=conf, lock_state=lock)
+        assert inplace.update_inplace(t, total, ev, direction_conf=conf, lock_state=lock) is None
+        assert (inplace.state, inplace.aw_state) == (snap.state, snap.aw_state)
+    assert inplace.snapshot is None and full.snapshot is snap
+
+
+class _L2Str(str):
+    """str subclass as L2 may hand over (cf. numpy.str_); cannot be sys.intern()ed."""
+
+
+def test_str_subclass_lock_state_and_direction():
+    l1 = L1PhysicalActivity()
+    s = l1.update(1.0, 1.0, 1, lock_state=_L2Str("LOCKED"), direction_effective=_L2Str("CW"))
+    assert (s.lock_state, s.direction_effective) == ("LOCKED", "CW")
+    assert l1._lock_moving
+    s = l1.update(1.1, 2.0, 1, lock_state=_L2Str("UNLOCKED"))
+    assert s.lock_state == "UNLOCKED" and not l1._lock_moving
+
+
+@pytest.mark.parametrize("field", ["activity_hysteresis", "displacement_hysteresis"])
+@pytest.mark.parametrize("value", [-0.1, 1.0, 1.5])
+def test_hysteresis_outside_unit_interval_rejected(field, value):
+    with pytest.raises(ValueError, match=field):
+        L1Config(**{field: value})
+
+
+def test_snapshot_fields_land_in_place():
+    l1 = L1PhysicalActivity()
+    l1.update(1.0, 0.0, 0)
+    s = l1.update(1.1, 1.0, 3, direction_conf=0.4, lock_state="LOCKED", direction_effective="CW")
+    assert (s.total_events, s.delta_events, s.total_cycles, s.delta_cycles) == (3, 3, 1.0, 1.0)
+    assert (s.direction_effective, s.direction_conf, s.lock_state) == ("CW", 0.4, "LOCKED")
+    assert (s.ageC_s, s.ageE_s, s.l2_stale) == (0.0, 0.0, False)
+    assert s.dt_s == pytest.approx(0.1)
+    assert s.mdi_mode == l1.config.mdi_mode
+    assert isinstance(s.aw_state, AwState) and isinstance(s.aw_reason, AwReason)
+
+
+def _rescan(entries, cutoff):
+    """Reference for _PoolWindow.stats(): the full per-tick window scan."""
+    n = valid = changes = switches = 0
+    unique, last, ps = set(), {}, None
+    for t, s, p in entries:
+        if t < cutoff:
+            continue
+        n += 1
+        if p in (0, 1, 2):
+            valid += 1
+            unique.add(p)
+            side = s != 0
+            changes += side in last and last[side] != p
+            last[side] = p
+        switches += ps is not None and ps != s
+        ps = s
+    return n, valid, changes, switches, unique
+
+
+@pytest.mark.parametrize("jitter", [0.0, 0.1], ids=["ordered", "out_of_order"])
+def test_pool_window_stats_match_rescan(jitter):
+    from sym_cycles.l1_physical_activity import _PoolWindow
+    rng = random.Random(1)
+    win, ref, t = _PoolWindow(), [], 0.0
+    for _ in range(2000):
+        t += rng.random() * 0.05
+        entry = (t - (rng.random() * jitter if rng.random() < 0.1 else 0.0),
+                 rng.choice((0, 1, 2)), rng.choice((None, 0, 1, 2, 3)))
+        win.append(*entry)
+        ref.append(entry)
+        cutoff = t - rng.choice((0.1, 0.3, 0.5))
+        win.expire(cutoff)
+        while ref and ref[0][0] < cutoff:
+            ref.pop(0)
+        assert win.stats(cutoff) == _rescan(ref, cutoff)
+
+
+def test_history_ring_keeps_last_capacity_snapshots():
+    pytest.importorskip("numpy")
+    from sym_cycles.l1_physical_activity import L1HistoryRing
+    rows = _stream(0, n=50)
+    live, ring = L1PhysicalActivity(), L1HistoryRing(capacity=16)
+    snaps = []
+    for t, total, ev, conf, lock in rows:
+        snaps.append(live.update(t, total, ev, direction_conf=conf, lock_state=lock))
+        ring.push(snaps[-1], t)
+
+    cols = ring.columns()
+    assert len(ring) == 16
+    assert list(cols["wall_time"]) == [r[0] for r in rows[-16:]]
+    assert list(cols["state"]) == [s.state for s in snaps[-16:]]
+    assert list(cols["activity_score"]) == [s.activity_score for s in snaps[-16:]]
+
+    direct, recorder = L1HistoryRing(capacity=16), L1PhysicalActivity()
+    for t, total, ev, conf, lock in rows:
+        recorder.update_inplace(t, total, ev, direction_conf=conf, lock_state=lock, record_to=direct)
+    for name, col in direct.columns().items():
+        assert list(col) == list(cols[name]), name